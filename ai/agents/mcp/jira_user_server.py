@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
-from typing import List, Optional
+import time
+from pathlib import Path
+from typing import Any, List, Optional
 
 import requests
 from requests.auth import HTTPBasicAuth
@@ -15,6 +18,21 @@ logger = logging.getLogger(__name__)
 
 mcp = FastMCP("Jira User Information Tools")
 
+# The MCP adapter spawns this server per tool call, so the cache lives on disk.
+# It holds account emails: keep it in the user's cache dir, outside the working
+# tree, readable only by the owner.
+_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "project-management-ai"
+    / "jira_users_cache.json"
+)
+# Only the fields JiraUserEntry exposes are persisted.
+_CACHED_USER_FIELDS = ("accountId", "emailAddress", "username")
+JIRA_USERS_CACHE_TTL_SECONDS = 300
+JIRA_USERS_PAGE_SIZE = 1000
+
+_session: Optional[requests.Session] = None
+
 
 class JiraUserEntry(BaseModel):
     account_id: str = Field(alias="accountId")
@@ -46,6 +64,66 @@ def _build_client() -> tuple[str, HTTPBasicAuth]:
     return normalized, auth
 
 
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.headers.update({"Accept": "application/json"})
+    return _session
+
+
+def _load_cache() -> dict[str, Any]:
+    if not _CACHE_FILE.exists():
+        return {}
+
+    try:
+        with _CACHE_FILE.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+        if isinstance(data, dict):
+            return data
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning("Failed to load Jira user cache: %s", exc)
+    return {}
+
+
+def _save_cache(cache: dict[str, Any]) -> None:
+    tmp_file = _CACHE_FILE.with_suffix(".tmp")
+    try:
+        _CACHE_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Create the file 0600 up front rather than chmod-ing after the write.
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(cache, handle)
+        os.replace(tmp_file, _CACHE_FILE)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning("Failed to persist Jira user cache: %s", exc)
+
+
+def _parse_users(items: List[dict[str, Any]]) -> List[JiraUserEntry]:
+    results: List[JiraUserEntry] = []
+    for item in items:
+        account_id = item.get("accountId")
+        email = item.get("emailAddress")
+        username = item.get("username")
+        # Jira's schema is stable; only fall back to validation for odd entries.
+        if (
+            isinstance(account_id, str)
+            and isinstance(email, (str, type(None)))
+            and isinstance(username, (str, type(None)))
+        ):
+            results.append(
+                JiraUserEntry.model_construct(
+                    account_id=account_id, email=email, username=username
+                )
+            )
+            continue
+        try:
+            results.append(JiraUserEntry.model_validate(item))
+        except Exception as exc:
+            logger.warning("Failed to parse Jira user entry %s: %s", item, exc)
+    return results
+
+
 @mcp.tool()
 def get_jira_users() -> List[JiraUserEntry]:
     """
@@ -57,32 +135,75 @@ def get_jira_users() -> List[JiraUserEntry]:
     base_url, auth = _build_client()
     url = f"{base_url}/rest/api/3/users/search"
 
-    try:
-        response = requests.get(
-            url,
-            auth=auth,
-            headers={"Accept": "application/json"},
-            timeout=15,
-        )
-        response.raise_for_status()
-    except requests.RequestException as exc:
-        raise RuntimeError(f"Failed to contact Jira API: {exc}") from exc
-
-    payload = response.json()
-    if not isinstance(payload, list):
-        raise RuntimeError("Unexpected Jira API response: expected a list")
-
-    results: List[JiraUserEntry] = []
-    for item in payload:
-        # Skip non-human accounts
-        if item.get("accountType") != "atlassian":
-            continue
+    cache = _load_cache()
+    cached_users = cache.get("users")
+    if cache.get("url") != url or not isinstance(cached_users, list):
+        cache, cached_users = {}, None
+
+    now = time.time()
+    if (
+        cached_users is not None
+        and now - float(cache.get("fetched_at", 0)) < JIRA_USERS_CACHE_TTL_SECONDS
+    ):
+        return _parse_users(cached_users)
+
+    # A 304 only proves the first page is unchanged, so revalidation is only
+    # used when the cached list came from a single page.
+    etag = cache.get("etag") if cached_users is not None else None
+
+    users: List[dict[str, Any]] = []
+    page_etag: Optional[str] = None
+    start_at = 0
+    pages = 0
+    while True:
+        headers = {"If-None-Match": etag} if etag and start_at == 0 else {}
         try:
-            results.append(JiraUserEntry.model_validate(item))
-        except Exception as exc:
-            logger.warning("Failed to parse Jira user entry %s: %s", item, exc)
+            response = _get_session().get(
+                url,
+                auth=auth,
+                headers=headers,
+                params={"startAt": start_at, "maxResults": JIRA_USERS_PAGE_SIZE},
+                timeout=15,
+            )
+            response.raise_for_status()
+        except requests.RequestException as exc:
+            raise RuntimeError(f"Failed to contact Jira API: {exc}") from exc
+
+        if response.status_code == 304 and cached_users is not None:
+            cache["fetched_at"] = now
+            _save_cache(cache)
+            return _parse_users(cached_users)
+
+        batch = response.json()
+        if not isinstance(batch, list):
+            raise RuntimeError("Unexpected Jira API response: expected a list")
+
+        if start_at == 0:
+            page_etag = response.headers.get("ETag")
+
+        # Jira may return fewer than maxResults before the end of the
+        # directory, so only an empty page marks the last one.
+        if not batch:
+            break
+        pages += 1
 
-    return results
+        # Skip non-human accounts
+        users.extend(
+            {field: item.get(field) for field in _CACHED_USER_FIELDS}
+            for item in batch
+            if item.get("accountType") == "atlassian"
+        )
+        start_at += len(batch)
+
+    _save_cache(
+        {
+            "url": url,
+            "etag": page_etag if pages <= 1 else None,
+            "fetched_at": now,
+            "users": users,
+        }
+    )
+    return _parse_users(users)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,36 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import heapq
 import math
 import re
+import time
 import uuid
 import zlib
 from collections import Counter
-from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
 
+import numpy as np
+import orjson
 from mcp.server.fastmcp import FastMCP
-from openai import OpenAI
+from openai import AsyncOpenAI
 from pydantic import BaseModel
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.models import (
     Distance,
-    NamedVector,
+    Filter,
+    Fusion,
+    FusionQuery,
+    IsEmptyCondition,
+    PayloadField,
+    PayloadSelectorExclude,
     PointIdsList,
     PointStruct,
+    Prefetch,
     SparseVector,
     SparseVectorParams,
     VectorParams,
@@ -27,12 +39,42 @@ from qdrant_client.http.models import (
 from config import get_settings
 
 
-mcp = FastMCP("Tools to add and search saved information from slack")
+@asynccontextmanager
+async def _warm_service(server: FastMCP) -> AsyncIterator[None]:
+    # Connect to Qdrant while the client is still completing the MCP handshake,
+    # so the first tool call doesn't pay for it. A failed warm-up is retried
+    # (and surfaced) by the first get_service() call.
+    task = _start_service()
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+    yield
+
+
+mcp = FastMCP(
+    "Tools to add and search saved information from slack", lifespan=_warm_service
+)
 
 TOKEN_PATTERN = re.compile(r"[\w']+")
 BM25_K1 = 1.5
 BM25_B = 0.75
+SCROLL_PAGE_SIZE = 1024
+SEARCH_PREFETCH_FACTOR = 4
+# The LLM relevance filter is skipped when there is too little to filter or the
+# fused scores don't separate candidates; this trades a little precision for
+# one fewer LLM round-trip per search.
+LLM_FILTER_MIN_CANDIDATES = 3
+LLM_FILTER_MIN_SCORE_SPREAD = 0.1
+# Saves only weight the new documents' sparse vectors, so older ones drift from
+# the current IDF. Reweight everything once the saves since the last rebuild
+# amount to a sizeable share of the corpus (amortised O(1) per saved document).
+SPARSE_REWEIGHT_MIN_DOCS = 50
+SPARSE_REWEIGHT_RATIO = 0.2
+# Searches reuse the last stats this process loaded or wrote; the TTL bounds
+# how long writes made by another process (e.g. the stdio server) go unseen.
+STATS_CACHE_TTL_SECONDS = 30.0
 DEFAULT_EMBED_MODEL = "text-embedding-3-small"
+# Qdrant only accepts unsigned ints or UUIDs as point ids, so the stats point
+# uses a stable UUID derived from its name.
+STATS_POINT_ID = str(uuid.uuid5(uuid.NAMESPACE_URL, "__bm25_stats__"))
 EMBEDDING_SIZES = {
     "text-embedding-3-small": 1536,
     "text-embedding-3-large": 3072,
@@ -40,13 +82,40 @@ EMBEDDING_SIZES = {
 
 
 def _tokenize(text: str) -> List[str]:
-    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
+    return TOKEN_PATTERN.findall(text.lower())
 
 
+@lru_cache(maxsize=65536)
 def _token_hash(token: str) -> int:
+    # crc32 is kept (rather than the salted builtin ``hash``) so sparse indices
+    # stay stable across processes and match vectors already stored in Qdrant.
     return zlib.crc32(token.encode("utf-8")) & 0xFFFFFFFF
 
 
+def _bm25_norm(doc_len: int, avgdl: float) -> float:
+    return BM25_K1 * (1 - BM25_B + BM25_B * (doc_len / avgdl if avgdl else 0))
+
+
+def _bm25_weight(freq: int, df: int, norm: float, total_docs: int) -> float:
+    """Return the BM25 weight of one term; callers skip terms with ``df == 0``."""
+
+    denom = freq + norm
+    if denom == 0:
+        return 0.0
+    idf = math.log((total_docs - df + 0.5) / (df + 0.5) + 1.0)
+    return idf * ((freq * (BM25_K1 + 1)) / denom)
+
+
+def _min_max_normalize(values: np.ndarray) -> np.ndarray:
+    """Scale values to [0, 1]; a constant column maps to 0.5."""
+
+    min_v = values.min()
+    span = values.max() - min_v
+    if span == 0:
+        return np.full_like(values, 0.5)
+    return (values - min_v) / span
+
+
 @dataclass
 class MemoryRecord:
     id: str
@@ -56,6 +125,13 @@ class MemoryRecord:
     tokens: List[str]
     source_text: Optional[str]
     created_at: str
+    tf: Counter = field(init=False, repr=False)
+    doc_len: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Term frequencies never change after load, so compute them once.
+        self.tf = Counter(self.tokens)
+        self.doc_len = len(self.tokens)
 
     @property
     def primary_keyword(self) -> Optional[str]:
@@ -69,7 +145,6 @@ class MemoryRecord:
             "source_text": self.source_text,
             "created_at": self.created_at,
             "tokens": self.tokens,
-            "dense_vector": self.dense_vector,
         }
 
     def to_point(
@@ -84,6 +159,100 @@ class MemoryRecord:
         return PointStruct(id=self.id, vector=vectors, payload=self.payload())
 
 
+@dataclass
+class MemoryCorpus:
+    """Struct-of-arrays view over stored memories, as returned by a full scroll."""
+
+    ids: List[str] = field(default_factory=list)
+    facts: List[str] = field(default_factory=list)
+    keywords: List[List[str]] = field(default_factory=list)
+    tokens: List[List[str]] = field(default_factory=list)
+    source_texts: List[Optional[str]] = field(default_factory=list)
+    created_at: List[str] = field(default_factory=list)
+    embeddings: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def record(self, row: int) -> MemoryRecord:
+        dense_vector = (
+            self.embeddings[row].tolist() if self.embeddings is not None else []
+        )
+        return MemoryRecord(
+            id=self.ids[row],
+            fact=self.facts[row],
+            keywords=self.keywords[row],
+            dense_vector=dense_vector,
+            tokens=self.tokens[row],
+            source_text=self.source_texts[row],
+            created_at=self.created_at[row],
+        )
+
+
+@dataclass
+class BM25Stats:
+    """Corpus-wide BM25 statistics maintained incrementally alongside the memories."""
+
+    doc_freq: Counter = field(default_factory=Counter)
+    keyword_freq: Counter = field(default_factory=Counter)
+    total_len: int = 0
+    doc_count: int = 0
+    stale_docs: int = 0
+
+    @property
+    def avgdl(self) -> float:
+        return (self.total_len / self.doc_count) if self.doc_count else 0.0
+
+    @property
+    def keywords(self) -> List[str]:
+        return sorted(self.keyword_freq)
+
+    @property
+    def needs_reweight(self) -> bool:
+        threshold = max(SPARSE_REWEIGHT_MIN_DOCS, SPARSE_REWEIGHT_RATIO * self.doc_count)
+        return self.stale_docs >= threshold
+
+    def add(self, tf: Counter, keywords: Iterable[str]) -> None:
+        self.keyword_freq.update(set(keywords))
+        if not tf:
+            return
+        self.doc_count += 1
+        self.total_len += sum(tf.values())
+        self.doc_freq.update(tf.keys())
+
+    def remove(self, tf: Counter, keywords: Iterable[str]) -> None:
+        # Counter subtraction drops non-positive entries, keeping the maps compact.
+        self.keyword_freq -= Counter(set(keywords))
+        if not tf:
+            return
+        self.doc_count = max(0, self.doc_count - 1)
+        self.total_len = max(0, self.total_len - sum(tf.values()))
+        self.doc_freq -= Counter(tf.keys())
+
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "doc_freq": dict(self.doc_freq),
+            "keyword_freq": dict(self.keyword_freq),
+            "total_len": self.total_len,
+            "doc_count": self.doc_count,
+            "stale_docs": self.stale_docs,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "BM25Stats":
+        return cls(
+            doc_freq=Counter(
+                {str(k): int(v) for k, v in (payload.get("doc_freq") or {}).items()}
+            ),
+            keyword_freq=Counter(
+                {str(k): int(v) for k, v in (payload.get("keyword_freq") or {}).items()}
+            ),
+            total_len=int(payload.get("total_len") or 0),
+            doc_count=int(payload.get("doc_count") or 0),
+            stale_docs=int(payload.get("stale_docs") or 0),
+        )
+
+
 class FactCandidateSchema(BaseModel):
     relevant_ids: list[str]
 
@@ -112,18 +281,24 @@ class MemoryService:
         )
 
         self.llm_model = config.llm_model
+        self.use_llm_filter = config.use_llm_filter
 
-        self.openai = OpenAI(api_key=config.openai_api_key)
+        self.openai = AsyncOpenAI(api_key=config.openai_api_key)
 
-        self.client = QdrantClient(
+        self.client = AsyncQdrantClient(
             host=config.qdrant_host,
             port=config.qdrant_http_port,
         )
 
-        self._ensure_collection()
+        # The stats point is read-modify-written by every save and delete, so
+        # those updates are serialised within the process; writers in other
+        # processes are caught by _reconcile_stats.
+        self._stats_lock = asyncio.Lock()
+        self._stats_cache: Optional[BM25Stats] = None
+        self._stats_cached_at = 0.0
 
-    def _ensure_collection(self) -> None:
-        if self.client.collection_exists(self.collection_name):
+    async def _ensure_collection(self) -> None:
+        if await self.client.collection_exists(self.collection_name):
             return
 
         vector_params = {
@@ -135,7 +310,7 @@ class MemoryService:
         sparse_params = {
             self.sparse_name: SparseVectorParams(),
         }
-        self.client.create_collection(
+        await self.client.create_collection(
             collection_name=self.collection_name,
             vectors_config=vector_params,
             sparse_vectors_config=sparse_params,
@@ -144,7 +319,7 @@ class MemoryService:
     # -----------------------
     # OpenAI helpers
     # -----------------------
-    def _extract_memories(
+    async def _extract_memories(
         self, text: str, existing_keywords: List[str]
     ) -> List[Dict[str, Any]]:
         if not text or not text.strip():
@@ -165,7 +340,7 @@ class MemoryService:
             "Text:\n{text}\n"
         ).format(keywords=keyword_text, text=text)
 
-        response = self.openai.responses.parse(
+        response = await self.openai.responses.parse(
             model=self.llm_model,
             input=[
                 {"role": "system", "content": system_message},
@@ -175,8 +350,8 @@ class MemoryService:
         )
 
         try:
-            data = json.loads(response.output_text)
-        except json.JSONDecodeError as exc:  # pragma: no cover
+            data = orjson.loads(response.output_text)
+        except orjson.JSONDecodeError as exc:  # pragma: no cover
             raise RuntimeError("Failed to parse memory extraction response") from exc
 
         memories = []
@@ -193,7 +368,7 @@ class MemoryService:
             memories.append({"fact": fact, "keywords": deduped})
         return memories
 
-    def _filter_candidates(
+    async def _filter_candidates(
         self, query: str, candidates: List[Dict[str, Any]]
     ) -> List[str]:
         if not candidates:
@@ -215,9 +390,9 @@ class MemoryService:
         user_message = (
             "Given the query and candidate memories below, return the ids that should be kept."
             "\n\n{payload}"
-        ).format(payload=json.dumps(payload, ensure_ascii=False))
+        ).format(payload=orjson.dumps(payload).decode())
 
-        response = self.openai.responses.parse(
+        response = await self.openai.responses.parse(
             model=self.llm_model,
             input=[
                 {"role": "system", "content": system_message},
@@ -227,33 +402,57 @@ class MemoryService:
         )
 
         try:
-            data = json.loads(response.output_text)
-        except json.JSONDecodeError as exc:  # pragma: no cover
+            data = orjson.loads(response.output_text)
+        except orjson.JSONDecodeError as exc:  # pragma: no cover
             raise RuntimeError("Failed to parse memory filtering response") from exc
 
         return [item for item in data.get("relevant_ids", []) if item]
 
-    def _embed(self, text: str) -> List[float]:
-        response = self.openai.embeddings.create(
+    def _needs_llm_filter(self, candidates: List[Dict[str, Any]]) -> bool:
+        if not self.use_llm_filter or len(candidates) < LLM_FILTER_MIN_CANDIDATES:
+            return False
+        spread = candidates[0]["score"] - candidates[-1]["score"]
+        return spread >= LLM_FILTER_MIN_SCORE_SPREAD
+
+    async def _embed(self, text: str) -> List[float]:
+        return (await self._embed_many([text]))[0]
+
+    async def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        response = await self.openai.embeddings.create(
             model=self.embedding_model,
-            input=text,
+            input=texts,
         )
-        return list(response.data[0].embedding)
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [list(item.embedding) for item in ordered]
 
     # -----------------------
     # Qdrant helpers
     # -----------------------
-    def _fetch_existing(self) -> List[MemoryRecord]:
-        records: List[MemoryRecord] = []
+    async def _fetch_existing(self, include_vectors: bool = False) -> MemoryCorpus:
+        """Scroll every stored memory into a struct-of-arrays corpus.
+
+        Dense vectors are only transferred when ``include_vectors`` is set (the
+        rebuild path re-upserts points); BM25 consumers only need the payload.
+        Legacy points may still carry a ``dense_vector`` payload copy, which is
+        never read and is excluded from every scroll.
+        """
+
+        corpus = MemoryCorpus()
+        dense_rows: List[Any] = []
         next_offset: Optional[int] = None
 
+        with_payload = PayloadSelectorExclude(exclude=["dense_vector"])
+        with_vectors: Any = [self.dense_name] if include_vectors else False
+
         while True:
-            points, next_offset = self.client.scroll(
+            points, next_offset = await self.client.scroll(
                 collection_name=self.collection_name,
                 offset=next_offset,
-                limit=128,
-                with_payload=True,
-                with_vectors=True,
+                limit=SCROLL_PAGE_SIZE,
+                with_payload=with_payload,
+                with_vectors=with_vectors,
             )
 
             for point in points:
@@ -262,100 +461,137 @@ class MemoryService:
                 if not fact:
                     continue
 
-                keywords = [str(kw) for kw in payload.get("keywords", [])]
-                dense_vector: Optional[List[float]] = None
+                if include_vectors:
+                    dense_vector = None
+                    for vector_data in (
+                        getattr(point, "vector", None),
+                        getattr(point, "vectors", None),
+                    ):
+                        if isinstance(vector_data, dict):
+                            dense_vector = vector_data.get(self.dense_name)
+                        if dense_vector is not None:
+                            break
+                    if dense_vector is None:
+                        continue
+                    dense_rows.append(dense_vector)
+
+                corpus.ids.append(str(point.id))
+                corpus.facts.append(fact)
+                corpus.keywords.append([str(kw) for kw in payload.get("keywords", [])])
+                # Tokens are always persisted at save time; trust them.
+                corpus.tokens.append(payload.get("tokens") or [])
+                corpus.source_texts.append(payload.get("source_text"))
+                corpus.created_at.append(
+                    payload.get("created_at") or datetime.now(timezone.utc).isoformat()
+                )
 
-                if "dense_vector" in payload:
-                    dense_vector = [float(val) for val in payload["dense_vector"]]
+            if next_offset is None:
+                break
 
-                vector_data = getattr(point, "vector", None)
-                named_vectors = getattr(point, "vectors", None)
+        if include_vectors and dense_rows:
+            corpus.embeddings = np.asarray(dense_rows, dtype=np.float32)
 
-                if dense_vector is None and isinstance(vector_data, dict):
-                    dense_candidate = vector_data.get(self.dense_name)
-                    if dense_candidate is not None:
-                        dense_vector = list(dense_candidate)
+        return corpus
 
-                if dense_vector is None and isinstance(named_vectors, dict):
-                    dense_candidate = named_vectors.get(self.dense_name)
-                    if dense_candidate is not None:
-                        dense_vector = list(dense_candidate)
+    async def _load_stats(self) -> Optional[BM25Stats]:
+        points = await self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=[STATS_POINT_ID],
+            with_payload=True,
+            with_vectors=False,
+        )
+        if not points:
+            return None
+        return BM25Stats.from_payload(points[0].payload or {})
 
-                if dense_vector is None:
-                    continue
+    def _stats_point(self, stats: BM25Stats) -> PointStruct:
+        return PointStruct(id=STATS_POINT_ID, vector={}, payload=stats.payload())
 
-                tokens = payload.get("tokens")
-                if not tokens:
-                    tokens = _tokenize(fact)
+    async def _save_stats(self, stats: BM25Stats) -> None:
+        await self.client.upsert(
+            collection_name=self.collection_name,
+            points=[self._stats_point(stats)],
+        )
 
-                created_at = (
-                    payload.get("created_at") or datetime.now(timezone.utc).isoformat()
-                )
-                source_text = payload.get("source_text")
+    def _cache_stats(self, stats: BM25Stats) -> None:
+        # Cached stats are replaced, never mutated, so readers holding the
+        # previous object are unaffected by a concurrent write.
+        self._stats_cache = stats
+        self._stats_cached_at = time.monotonic()
+
+    async def _get_stats(self) -> BM25Stats:
+        """Return recent stats for read paths without fetching them on every call."""
+
+        cached = self._stats_cache
+        if (
+            cached is not None
+            and time.monotonic() - self._stats_cached_at < STATS_CACHE_TTL_SECONDS
+        ):
+            return cached
+
+        stats = await self._load_stats()
+        if stats is None:
+            # First use of a collection without stats (new or legacy).
+            return await self.rebuild()
+        self._cache_stats(stats)
+        return stats
+
+    async def _count_documents(self) -> int:
+        # Matches BM25Stats.doc_count: only memories with tokens are counted,
+        # and the stats point has none.
+        result = await self.client.count(
+            collection_name=self.collection_name,
+            count_filter=Filter(
+                must_not=[IsEmptyCondition(is_empty=PayloadField(key="tokens"))]
+            ),
+            exact=True,
+        )
+        return result.count
 
-                record = MemoryRecord(
-                    id=str(point.id),
-                    fact=fact,
-                    keywords=keywords,
-                    dense_vector=list(dense_vector),
-                    tokens=list(tokens),
-                    source_text=source_text,
-                    created_at=created_at,
-                )
-                records.append(record)
+    async def _reconcile_stats(self, stats: BM25Stats) -> BM25Stats:
+        """Rebuild when a concurrent writer in another process lost an update.
 
-            if next_offset is None:
-                break
+        Stats are written back as a whole, so a save in another process that
+        interleaves with ours overwrites (or is overwritten by) this one; the
+        document count no longer matching the collection is the tell. Must be
+        called with ``_stats_lock`` held.
+        """
 
-        return records
+        if await self._count_documents() == stats.doc_count:
+            return stats
+        return await self._rebuild_locked()
 
     # -----------------------
     # BM25 helpers
     # -----------------------
-    def _collect_stats(
-        self, records: Iterable[MemoryRecord]
-    ) -> tuple[Counter, float, int]:
-        doc_freq: Counter = Counter()
-        total_len = 0
-        valid_records = 0
-
+    def _collect_stats(self, records: Iterable[MemoryRecord]) -> BM25Stats:
+        stats = BM25Stats()
         for record in records:
-            if not record.tokens:
-                continue
-            valid_records += 1
-            token_set = set(record.tokens)
-            doc_freq.update(token_set)
-            total_len += len(record.tokens)
-
-        avgdl = (total_len / valid_records) if valid_records else 0.0
-        return doc_freq, avgdl, valid_records
+            stats.add(record.tf, record.keywords)
+        return stats
 
     def _build_sparse_vector(
         self,
-        tokens: List[str],
+        tf: Counter,
+        doc_len: int,
         doc_freq: Counter,
         avgdl: float,
         total_docs: int,
     ) -> SparseVector:
-        if not tokens or total_docs == 0:
+        if not tf or total_docs == 0:
             return SparseVector(indices=[], values=[])
 
-        tf = Counter(tokens)
-        doc_len = len(tokens)
+        norm = _bm25_norm(doc_len, avgdl)
         indices: List[int] = []
         values: List[float] = []
 
+        # A plain loop beats NumPy here: documents are a handful of distinct
+        # terms, so array setup would dominate the arithmetic.
         for token, freq in tf.items():
             df = doc_freq.get(token, 0)
             if df == 0:
                 continue
-            idf = math.log((total_docs - df + 0.5) / (df + 0.5) + 1.0)
-            denom = freq + BM25_K1 * (
-                1 - BM25_B + BM25_B * (doc_len / avgdl if avgdl else 0)
-            )
-            if denom == 0:
-                continue
-            weight = idf * ((freq * (BM25_K1 + 1)) / denom)
+            weight = _bm25_weight(freq, df, norm, total_docs)
             if weight <= 0:
                 continue
             indices.append(_token_hash(token))
@@ -371,77 +607,82 @@ class MemoryService:
         avgdl: float,
         total_docs: int,
     ) -> float:
-        if not record.tokens or total_docs == 0:
+        if not record.doc_len or total_docs == 0:
             return 0.0
 
-        tf = Counter(record.tokens)
-        doc_len = len(record.tokens)
+        tf = record.tf
+        norm = _bm25_norm(record.doc_len, avgdl)
         score = 0.0
 
-        for token, freq_q in query_counts.items():
-            df = doc_freq.get(token, 0)
-            if df == 0:
-                continue
-            idf = math.log((total_docs - df + 0.5) / (df + 0.5) + 1.0)
+        for token in query_counts:
             freq_d = tf.get(token, 0)
             if freq_d == 0:
                 continue
-            denom = freq_d + BM25_K1 * (
-                1 - BM25_B + BM25_B * (doc_len / avgdl if avgdl else 0)
-            )
-            if denom == 0:
+            df = doc_freq.get(token, 0)
+            if df == 0:
                 continue
-            score += idf * ((freq_d * (BM25_K1 + 1)) / denom)
+            score += _bm25_weight(freq_d, df, norm, total_docs)
 
         return score
 
     # -----------------------
     # Public API
     # -----------------------
-    def save(self, text: str) -> Dict[str, Any]:
-        existing_records = self._fetch_existing()
-        existing_keywords = sorted(
-            {kw for record in existing_records for kw in record.keywords}
-        )
+    async def save(self, text: str) -> Dict[str, Any]:
+        stats = await self._get_stats()
 
-        extracted = self._extract_memories(text, existing_keywords)
+        extracted = await self._extract_memories(text, stats.keywords)
         if not extracted:
             return {"saved": 0, "message": "No factual memories detected."}
 
         new_records: List[MemoryRecord] = []
         now_iso = datetime.now(timezone.utc).isoformat()
-        for item in extracted:
+        embeddings = await self._embed_many([item["fact"] for item in extracted])
+        for item, embedding in zip(extracted, embeddings):
             fact = item["fact"]
             keywords = item["keywords"]
-            embedding = self._embed(fact)
             tokens = _tokenize(fact)
-            record = MemoryRecord(
-                id=str(uuid.uuid4()),
-                fact=fact,
-                keywords=keywords,
-                dense_vector=embedding,
-                tokens=tokens,
-                source_text=text,
-                created_at=now_iso,
+            new_records.append(
+                MemoryRecord(
+                    id=str(uuid.uuid4()),
+                    fact=fact,
+                    keywords=keywords,
+                    dense_vector=embedding,
+                    tokens=tokens,
+                    source_text=text,
+                    created_at=now_iso,
+                )
             )
-            new_records.append(record)
 
-        all_records = existing_records + new_records
-        doc_freq, avgdl, total_docs = self._collect_stats(all_records)
+        async with self._stats_lock:
+            # Re-read under the lock: the cached copy may predate another save.
+            stats = await self._load_stats()
+            if stats is None:
+                stats = await self._rebuild_locked()
+            for record in new_records:
+                stats.add(record.tf, record.keywords)
+            stats.stale_docs += len(new_records)
+
+            points = []
+            for record in new_records:
+                sparse_vector = self._build_sparse_vector(
+                    record.tf,
+                    record.doc_len,
+                    stats.doc_freq,
+                    stats.avgdl,
+                    stats.doc_count,
+                )
+                points.append(
+                    record.to_point(self.dense_name, self.sparse_name, sparse_vector)
+                )
+            points.append(self._stats_point(stats))
 
-        points = []
-        for record in all_records:
-            sparse_vector = self._build_sparse_vector(
-                record.tokens,
-                doc_freq,
-                avgdl,
-                total_docs,
-            )
-            points.append(
-                record.to_point(self.dense_name, self.sparse_name, sparse_vector)
-            )
+            await self.client.upsert(collection_name=self.collection_name, points=points)
 
-        self.client.upsert(collection_name=self.collection_name, points=points)
+            stats = await self._reconcile_stats(stats)
+            if stats.needs_reweight:
+                stats = await self._rebuild_locked()
+            self._cache_stats(stats)
 
         return {
             "saved": len(new_records),
@@ -451,31 +692,78 @@ class MemoryService:
             ),
         }
 
-    def search(
+    async def rebuild(self) -> BM25Stats:
+        """Recompute BM25 statistics and sparse vectors for every stored memory.
+
+        Points are re-upserted with a fresh payload, which also strips the
+        redundant ``dense_vector`` payload written by older versions.
+        """
+
+        async with self._stats_lock:
+            stats = await self._rebuild_locked()
+            self._cache_stats(stats)
+        return stats
+
+    async def _rebuild_locked(self) -> BM25Stats:
+        corpus = await self._fetch_existing(include_vectors=True)
+        records = [corpus.record(row) for row in range(len(corpus))]
+        stats = self._collect_stats(records)
+
+        points = []
+        for record in records:
+            sparse_vector = self._build_sparse_vector(
+                record.tf,
+                record.doc_len,
+                stats.doc_freq,
+                stats.avgdl,
+                stats.doc_count,
+            )
+            points.append(
+                record.to_point(self.dense_name, self.sparse_name, sparse_vector)
+            )
+        points.append(self._stats_point(stats))
+
+        await self.client.upsert(collection_name=self.collection_name, points=points)
+        return stats
+
+    async def search(
         self,
         query: str,
         limit: int = 6,
         group_size: int = 3,
     ) -> List[Dict[str, Any]]:
-        records = self._fetch_existing()
-        if not records:
+        query_counts = Counter(_tokenize(query))
+        if not query_counts:
             return []
 
-        dense_query = self._embed(query)
-        query_tokens = _tokenize(query)
-        query_counts = Counter(query_tokens)
-
-        doc_freq, avgdl, total_docs = self._collect_stats(records)
-        if not query_counts:
+        dense_query, stats = await asyncio.gather(
+            self._embed(query),
+            self._get_stats(),
+        )
+        if not stats.doc_count:
             return []
 
-        search_groups_result = self.client.search_groups(
+        # Stored sparse vectors already carry the BM25 weight of each term, so a
+        # term-indicator query makes the sparse dot product the BM25 score.
+        sparse_query = SparseVector(
+            indices=[_token_hash(token) for token in query_counts],
+            values=[1.0] * len(query_counts),
+        )
+        prefetch_limit = max(1, limit) * max(1, group_size) * SEARCH_PREFETCH_FACTOR
+
+        search_groups_result = await self.client.query_points_groups(
             collection_name=self.collection_name,
-            query_vector=NamedVector(name=self.dense_name, vector=dense_query),
+            prefetch=[
+                Prefetch(query=dense_query, using=self.dense_name, limit=prefetch_limit),
+                Prefetch(
+                    query=sparse_query, using=self.sparse_name, limit=prefetch_limit
+                ),
+            ],
+            query=FusionQuery(fusion=Fusion.RRF),
             limit=max(1, limit),
             group_by="primary_keyword",
             group_size=max(1, group_size),
-            with_payload=True,
+            with_payload=PayloadSelectorExclude(exclude=["dense_vector"]),
         )
 
         groups = getattr(search_groups_result, "groups", None)
@@ -488,7 +776,6 @@ class MemoryService:
         if not groups:
             return []
 
-        record_by_id = {record.id: record for record in records}
         candidates: List[Dict[str, Any]] = []
 
         for group in groups:
@@ -502,28 +789,26 @@ class MemoryService:
                 continue
 
             for point in hits:
-                record = record_by_id.get(str(point.id))
-                if not record:
-                    payload = point.payload or {}
-                    fact = payload.get("fact")
-                    if not fact:
-                        continue
-                    tokens = payload.get("tokens") or _tokenize(fact)
-                    dense_vector = payload.get("dense_vector")
-                    if dense_vector is None:
-                        continue
-                    record = MemoryRecord(
-                        id=str(point.id),
-                        fact=fact,
-                        keywords=[str(kw) for kw in payload.get("keywords", [])],
-                        dense_vector=list(dense_vector),
-                        tokens=list(tokens),
-                        source_text=payload.get("source_text"),
-                        created_at=payload.get("created_at")
-                        or datetime.now(timezone.utc).isoformat(),
-                    )
+                payload = point.payload or {}
+                fact = payload.get("fact")
+                if not fact:
+                    continue
+                record = MemoryRecord(
+                    id=str(point.id),
+                    fact=fact,
+                    keywords=[str(kw) for kw in payload.get("keywords", [])],
+                    dense_vector=[],
+                    tokens=list(payload.get("tokens") or []),
+                    source_text=payload.get("source_text"),
+                    created_at=payload.get("created_at")
+                    or datetime.now(timezone.utc).isoformat(),
+                )
                 bm25_score = self._bm25_score(
-                    query_counts, record, doc_freq, avgdl, total_docs
+                    query_counts,
+                    record,
+                    stats.doc_freq,
+                    stats.avgdl,
+                    stats.doc_count,
                 )
                 candidates.append(
                     {
@@ -532,7 +817,7 @@ class MemoryService:
                         "keywords": record.keywords,
                         "created_at": record.created_at,
                         "source_text": record.source_text,
-                        "dense_score": float(getattr(point, "score", 0.0)),
+                        "fusion_score": float(getattr(point, "score", 0.0)),
                         "bm25_score": bm25_score,
                     }
                 )
@@ -540,30 +825,38 @@ class MemoryService:
         if not candidates:
             return []
 
-        dense_values = [candidate["dense_score"] for candidate in candidates]
-        bm25_values = [candidate["bm25_score"] for candidate in candidates]
-
-        def _normalize(values: List[float], value: float) -> float:
-            if not values:
-                return 0.0
-            min_v = min(values)
-            max_v = max(values)
-            if max_v == min_v:
-                return 0.5
-            return (value - min_v) / (max_v - min_v)
-
-        for candidate in candidates:
-            dense_norm = _normalize(dense_values, candidate["dense_score"])
-            bm25_norm = _normalize(bm25_values, candidate["bm25_score"])
-            candidate["score"] = 0.6 * dense_norm + 0.4 * bm25_norm
-
-        candidates.sort(key=lambda item: item["score"], reverse=True)
-        top_candidates = candidates[:limit]
-
-        relevant_ids = set(self._filter_candidates(query, top_candidates))
-        filtered = [
-            candidate for candidate in top_candidates if candidate["id"] in relevant_ids
-        ]
+        fusion_norm = _min_max_normalize(
+            np.fromiter(
+                (candidate["fusion_score"] for candidate in candidates),
+                dtype=np.float64,
+                count=len(candidates),
+            )
+        )
+        bm25_norm = _min_max_normalize(
+            np.fromiter(
+                (candidate["bm25_score"] for candidate in candidates),
+                dtype=np.float64,
+                count=len(candidates),
+            )
+        )
+        scores = 0.6 * fusion_norm + 0.4 * bm25_norm
+
+        for candidate, score in zip(candidates, scores.tolist()):
+            candidate["score"] = score
+
+        top_candidates = heapq.nlargest(
+            limit, candidates, key=lambda item: item["score"]
+        )
+
+        if self._needs_llm_filter(top_candidates):
+            relevant_ids = set(await self._filter_candidates(query, top_candidates))
+            filtered = [
+                candidate
+                for candidate in top_candidates
+                if candidate["id"] in relevant_ids
+            ]
+        else:
+            filtered = top_candidates
 
         return [
             {
@@ -577,32 +870,68 @@ class MemoryService:
         ]
 
 
-    def delete(self, memory_ids: Iterable[str]) -> Dict[str, Any]:
-        ids = [str(memory_id).strip() for memory_id in memory_ids if str(memory_id).strip()]
+    async def delete(self, memory_ids: Iterable[str]) -> Dict[str, Any]:
+        ids = [
+            str(memory_id).strip()
+            for memory_id in memory_ids
+            if str(memory_id).strip() and str(memory_id).strip() != STATS_POINT_ID
+        ]
         if not ids:
             return {"deleted": 0}
 
-        self.client.delete(
-            collection_name=self.collection_name,
-            points_selector=PointIdsList(points=ids),
-            wait=True,
-        )
+        async with self._stats_lock:
+            stats = await self._load_stats()
+            if stats is not None:
+                points = await self.client.retrieve(
+                    collection_name=self.collection_name,
+                    ids=ids,
+                    with_payload=True,
+                    with_vectors=False,
+                )
+                for point in points:
+                    payload = point.payload or {}
+                    stats.remove(
+                        Counter(payload.get("tokens") or []),
+                        [str(kw) for kw in payload.get("keywords", [])],
+                    )
+
+            await self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=PointIdsList(points=ids),
+                wait=True,
+            )
+
+            if stats is not None:
+                await self._save_stats(stats)
+                self._cache_stats(await self._reconcile_stats(stats))
 
         return {"deleted": len(ids)}
 
 
-_service: Optional[MemoryService] = None
+_service_task: Optional[asyncio.Task[MemoryService]] = None
+
+
+async def _create_service() -> MemoryService:
+    service = MemoryService()
+    await service._ensure_collection()
+    return service
 
 
-def get_service() -> MemoryService:
-    global _service
-    if _service is None:
-        _service = MemoryService()
-    return _service
+def _start_service() -> asyncio.Task[MemoryService]:
+    global _service_task
+    task = _service_task
+    if task is None or (task.done() and (task.cancelled() or task.exception())):
+        task = asyncio.create_task(_create_service())
+        _service_task = task
+    return task
+
+
+async def get_service() -> MemoryService:
+    return await _start_service()
 
 
 @mcp.tool()
-def save_memory(text: str) -> Dict[str, Any]:
+async def save_memory(text: str) -> Dict[str, Any]:
     """
     Save something to a memory group.
 
@@ -610,12 +939,12 @@ def save_memory(text: str) -> Dict[str, Any]:
 
     This will return all the text blobs that were saved and where they were saved to.
     """
-    service = get_service()
-    return service.save(text)
+    service = await get_service()
+    return await service.save(text)
 
 
 @mcp.tool()
-def search_memory(
+async def search_memory(
     query: str, limit: int = 6, group_size: int = 3
 ) -> List[Dict[str, Any]]:
     """
@@ -623,13 +952,19 @@ def search_memory(
     Anything can be stored in memories.
     It may not know anything about your request.
     """
-    service = get_service()
-    return service.search(query, limit=limit, group_size=group_size)
+    service = await get_service()
+    return await service.search(query, limit=limit, group_size=group_size)
+
+
+async def delete_memories(memory_ids: List[str]) -> Dict[str, Any]:
+    service = await get_service()
+    return await service.delete(memory_ids)
 
 
-def delete_memories(memory_ids: List[str]) -> Dict[str, Any]:
-    service = get_service()
-    return service.delete(memory_ids)
+async def rebuild_memory_index() -> Dict[str, Any]:
+    service = await get_service()
+    stats = await service.rebuild()
+    return {"documents": stats.doc_count, "vocabulary": len(stats.doc_freq)}
 
 
 if __name__ == "__main__":
@@ -2,28 +2,65 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Optional
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional
 
-from langchain_core.tools import BaseTool
+import httpx
+from langchain_core.tools import BaseTool, StructuredTool
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
 from langfuse.langchain import CallbackHandler as LangfuseCallbackHandler
 from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from langgraph.prebuilt import create_react_agent
 from langgraph.types import Command
+from mcp.types import Tool as MCPTool
 
+from ai.agents.react_agents.checkpointer import get_checkpointer
 from ai.agents.react_agents.thread_state import create_clear_thread_tool
 from ai.agents.react_agents.tool_wrappers import tool_approve
-from ai.prompts import get_agent_prompt
+from ai.prompts import aget_agent_prompt
 from config import get_settings
 from listeners.agent_interrupts import create_approval_tool
 from listeners.agent_interrupts.common import SlackContext
-from listeners.user_management_platforms import get_user_management_platforms
+from listeners.user_management_platforms import get_user_platform_slugs
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# MCP servers are spawned per tool call, so discovered tools stay valid until
+# the server set or the servers themselves change.
+TOOL_DISCOVERY_TTL_SECONDS = 300.0
+MCP_DISCOVERY_CONCURRENCY = 8
+# The v2 ReAct agent dispatches each tool call of a turn as its own task; cap
+# how many run at once so a wide turn can't open dozens of MCP sessions.
+AGENT_MAX_CONCURRENCY = 8
+
+_mcp_clients: dict[str, MultiServerMCPClient] = {}
+_MCP_HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+_MCP_HTTP_TIMEOUT = 30.0
+_discovery_semaphore = asyncio.Semaphore(MCP_DISCOVERY_CONCURRENCY)
+_server_tools: dict[str, tuple[float, list[BaseTool]]] = {}
+# In-flight discovery per server, shared by concurrent requests on a cold cache.
+_discovery_tasks: dict[str, asyncio.Task[None]] = {}
+
+# Last discovered tool schemas per server, so a fresh process can build its
+# tools without spawning every server just to list them.
+_MANIFEST_FILE = Path("data/mcp_tool_manifests.json")
+_manifests: Optional[dict[str, dict[str, Any]]] = None
+
+# Compiled agents per platform slug set, with the tool ids and prompt they were
+# built from so rediscovered tools or a new prompt trigger a rebuild.
+_agents: dict[frozenset[str], tuple[tuple[int, ...], str, Any]] = {}
+
+_context_tools: list[BaseTool] = [create_clear_thread_tool(), create_approval_tool()]
+
 _langfuse_handler: Optional[Any] = None
 _langfuse_handler_init_failed = False
 
@@ -56,37 +93,332 @@ def _get_langfuse_handler() -> Optional[Any]:
     return _langfuse_handler
 
 
-def _selected_platform_slugs(slack_context: Optional[SlackContext]) -> set[str]:
+def _selected_platform_slugs(slack_context: Optional[SlackContext]) -> frozenset[str]:
     """Return management platform slugs enabled for the requesting Slack user."""
 
     slack_user_id = slack_context.user_id if slack_context else None
-    selections = get_user_management_platforms(slack_user_id)
-    return {
-        selection.slug.lower()
-        for selection in selections
-        if getattr(selection, "slug", None)
+    # Drop slugs without a configured server so equivalent selections share
+    # the same server config and agent cache entries.
+    return settings.tooling.platform_slugs & get_user_platform_slugs(slack_user_id)
+
+
+class _SharedHTTPTransport(httpx.AsyncHTTPTransport):
+    """Keep-alive pool shared by every MCP HTTP session.
+
+    The MCP client closes its ``httpx.AsyncClient`` when a session ends, which
+    would normally tear down the pool; closing is a no-op here so connections
+    survive across tool calls.
+    """
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+
+_mcp_http_transport = _SharedHTTPTransport(limits=_MCP_HTTP_LIMITS)
+
+
+def _pooled_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """``httpx_client_factory`` for streamable HTTP MCP servers."""
+
+    return httpx.AsyncClient(
+        transport=_mcp_http_transport,
+        headers=headers,
+        timeout=timeout or httpx.Timeout(_MCP_HTTP_TIMEOUT),
+        auth=auth,
+        follow_redirects=True,
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_server_config(platform_slugs: frozenset[str]) -> dict[str, dict[str, Any]]:
+    """Return the MCP server configuration for the provided platform slugs."""
+
+    config = settings.tooling.server_config(platform_slugs)
+    for connection in config.values():
+        if connection.get("transport") == "streamable_http":
+            connection.setdefault("httpx_client_factory", _pooled_http_client)
+    return config
+
+
+def _get_mcp_client(name: str, connection: dict[str, Any]) -> MultiServerMCPClient:
+    """Return the shared single-server MCP client for ``name``."""
+
+    client = _mcp_clients.get(name)
+    if client is None:
+        client = MultiServerMCPClient({name: connection})
+        _mcp_clients[name] = client
+    return client
+
+
+def _connection_digest(connection: dict[str, Any]) -> str:
+    # Callables (e.g. the HTTP client factory) are identified by name, not address.
+    encoded = json.dumps(
+        connection,
+        sort_keys=True,
+        default=lambda value: getattr(value, "__qualname__", type(value).__name__),
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _load_manifests() -> dict[str, dict[str, Any]]:
+    global _manifests
+
+    if _manifests is not None:
+        return _manifests
+
+    _manifests = {}
+    if _MANIFEST_FILE.exists():
+        try:
+            with _MANIFEST_FILE.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+            if isinstance(data, dict):
+                _manifests = data
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("Failed to load MCP tool manifests: %s", exc)
+    return _manifests
+
+
+def _save_manifest(name: str, connection: dict[str, Any], tools: list[MCPTool]) -> None:
+    manifests = _load_manifests()
+    manifests[name] = {
+        "digest": _connection_digest(connection),
+        "tools": [tool.model_dump(mode="json") for tool in tools],
     }
+    try:
+        _MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with _MANIFEST_FILE.open("w", encoding="utf-8") as handle:
+            json.dump(manifests, handle)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning("Failed to persist MCP tool manifests: %s", exc)
 
 
-def _build_server_config(slack_context: Optional[SlackContext]) -> dict[str, dict[str, Any]]:
-    """Return the MCP server configuration for the provided Slack context."""
+def _tools_from_manifest(
+    name: str, connection: dict[str, Any]
+) -> Optional[list[BaseTool]]:
+    """Return tools built from the stored manifest if it matches the connection."""
 
-    platform_slugs = _selected_platform_slugs(slack_context)
-    return settings.tooling.server_config(platform_slugs)
+    entry = _load_manifests().get(name)
+    if not entry or entry.get("digest") != _connection_digest(connection):
+        return None
 
+    try:
+        mcp_tools = [MCPTool.model_validate(item) for item in entry.get("tools", [])]
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning("Ignoring invalid MCP tool manifest for %s: %s", name, exc)
+        return None
 
-async def ask_agent(
+    return [
+        convert_mcp_tool_to_langchain_tool(None, tool, connection=connection)
+        for tool in mcp_tools
+    ]
+
+
+async def _discover_server_tools(name: str, connection: dict[str, Any]) -> list[BaseTool]:
+    async with _discovery_semaphore:
+        mcp_tools: list[MCPTool] = []
+        async with _get_mcp_client(name, connection).session(name) as session:
+            cursor: Optional[str] = None
+            while True:
+                page = await session.list_tools(cursor=cursor)
+                mcp_tools.extend(page.tools)
+                cursor = page.nextCursor
+                if not cursor:
+                    break
+
+    _save_manifest(name, connection, mcp_tools)
+    # Tools open their own session per call, like MultiServerMCPClient.get_tools().
+    return [
+        convert_mcp_tool_to_langchain_tool(None, tool, connection=connection)
+        for tool in mcp_tools
+    ]
+
+
+@lru_cache(maxsize=1)
+def _inprocess_server_tools() -> dict[str, list[BaseTool]]:
+    """Return tools for the repo's own MCP servers that run in-process.
+
+    The FastMCP decorators return the plain functions, so they can be exposed
+    directly instead of spawning a stdio subprocess per call. The time server
+    has no state or dependencies and always runs in-process; the memory
+    server only does when ``MCP_INPROCESS`` is set.
+    """
+
+    from ai.agents.mcp import time_server
+
+    tools = {
+        "time": _wrap_for_approval(
+            [StructuredTool.from_function(func=time_server.get_datetime)]
+        ),
+    }
+    if not settings.mcp_inprocess:
+        return tools
+
+    from ai.agents.mcp import memory_agent
+
+    tools["memory"] = _wrap_for_approval(
+        [
+            StructuredTool.from_function(coroutine=memory_agent.save_memory),
+            StructuredTool.from_function(coroutine=memory_agent.search_memory),
+        ]
+    )
+    return tools
+
+
+def _wrap_for_approval(tools: list[BaseTool]) -> list[BaseTool]:
+    """Wrap tools that require human approval according to the tooling config."""
+
+    wrapped_tools: list[BaseTool] = []
+    approval_mapping = settings.tooling.tool_approvals
+
+    for tool in tools:
+        tool_name = getattr(tool, "name", "")
+        approval_settings = approval_mapping.get(tool_name)
+        if approval_settings:
+            wrapped_tools.append(
+                tool_approve(
+                    tool,
+                    summary=approval_settings.summary,
+                    context=approval_settings.context,
+                    allow_edit=approval_settings.allow_edit,
+                    allow_reject=approval_settings.allow_reject,
+                )
+            )
+            continue
+        wrapped_tools.append(tool)
+
+    return wrapped_tools
+
+
+async def _refresh_server_tools(name: str, connection: dict[str, Any]) -> None:
+    try:
+        tools = await _discover_server_tools(name, connection)
+    except Exception as exc:
+        # One unreachable server shouldn't take the whole agent down;
+        # it is retried on the next request.
+        logger.warning("Failed to load tools from MCP server %s", name, exc_info=exc)
+        return
+    finally:
+        _discovery_tasks.pop(name, None)
+    _server_tools[name] = (time.monotonic(), _wrap_for_approval(tools))
+
+
+def _discovery_task(name: str, connection: dict[str, Any]) -> asyncio.Task[None]:
+    """Return the running discovery for ``name``, starting one if needed."""
+
+    task = _discovery_tasks.get(name)
+    if task is None:
+        task = asyncio.create_task(_refresh_server_tools(name, connection))
+        _discovery_tasks[name] = task
+    return task
+
+
+def _needs_discovery(name: str, now: float) -> bool:
+    cached = _server_tools.get(name)
+    return cached is None or now - cached[0] >= TOOL_DISCOVERY_TTL_SECONDS
+
+
+async def _get_tools(platform_slugs: frozenset[str]) -> list[BaseTool]:
+    """Return MCP tools (wrapped for approval) for the platform slugs.
+
+    Tools are cached per server with a TTL so platform sets share the base
+    servers, and stale servers are started concurrently rather than one by one.
+    Concurrent requests join any discovery already in flight for a server.
+    A fresh process seeds the cache from the on-disk manifests, so servers are
+    only spawned when a tool is actually called or the TTL lapses.
+    """
+
+    now = time.monotonic()
+    server_config = _build_server_config(platform_slugs)
+    local_tools = _inprocess_server_tools()
+    for name, connection in server_config.items():
+        if name in local_tools or name in _server_tools:
+            continue
+        manifest_tools = _tools_from_manifest(name, connection)
+        if manifest_tools is not None:
+            _server_tools[name] = (now, _wrap_for_approval(manifest_tools))
+
+    stale = [
+        name
+        for name in server_config
+        if name not in local_tools and _needs_discovery(name, now)
+    ]
+
+    if stale:
+        # Shielded so a cancelled request doesn't abort discovery that other
+        # requests are waiting on.
+        await asyncio.gather(
+            *(
+                asyncio.shield(_discovery_task(name, server_config[name]))
+                for name in stale
+            )
+        )
+
+    tools: list[BaseTool] = []
+    seen: set[str] = set()
+    for name in server_config:
+        server_tools = local_tools.get(name)
+        if server_tools is None:
+            server_tools = _server_tools.get(name, (0.0, []))[1]
+        for tool in server_tools:
+            if tool.name in seen:
+                logger.debug(
+                    "Skipping duplicate tool %s from MCP server %s", tool.name, name
+                )
+                continue
+            seen.add(tool.name)
+            tools.append(tool)
+    return tools
+
+
+def _get_agent(
+    platform_slugs: frozenset[str],
+    tools: list[BaseTool],
+    checkpointer: AsyncPostgresSaver,
+    agent_prompt: str,
+) -> Any:
+    """Return the compiled ReAct agent for the tool set, building it on first use."""
+
+    tool_ids = tuple(id(tool) for tool in tools)
+    cached = _agents.get(platform_slugs)
+    if cached and cached[0] == tool_ids and cached[1] == agent_prompt:
+        return cached[2]
+
+    agent = create_react_agent(
+        settings.tooling.agent_model,
+        tools,
+        prompt=agent_prompt,
+        checkpointer=checkpointer,
+    )
+    _agents[platform_slugs] = (tool_ids, agent_prompt, agent)
+    return agent
+
+
+async def _prepare_run(
     payload: dict[str, Any] | Command,
     *,
-    thread_id: str | None = None,
-    slack_context: Optional[SlackContext] = None,
-):
+    thread_id: str | None,
+    slack_context: Optional[SlackContext],
+) -> tuple[Any, dict[str, Any]]:
+    """Return the compiled agent and run config for a request."""
+
     if isinstance(payload, dict) and "messages" not in payload:
         raise ValueError(
             "ask_agent expects a payload with a 'messages' key when using dict input."
         )
 
-    config: dict[str, Any] = {"configurable": {}}
+    # Context-dependent tools read the Slack context from here, which lets the
+    # compiled agent be shared across users.
+    config: dict[str, Any] = {
+        "configurable": {"slack_context": slack_context},
+        "max_concurrency": AGENT_MAX_CONCURRENCY,
+    }
 
     if thread_id:
         config["configurable"].update({"thread_id": thread_id})
@@ -111,55 +443,62 @@ async def ask_agent(
     if metadata:
         config["metadata"] = metadata
 
-    server_config = _build_server_config(slack_context)
-    client = MultiServerMCPClient(server_config)
+    platform_slugs = _selected_platform_slugs(slack_context)
+    # Tool discovery and the Postgres pool/setup are independent; on a cold
+    # start overlap them instead of paying for both in sequence.
+    discovered_tools, checkpointer = await asyncio.gather(
+        _get_tools(platform_slugs),
+        get_checkpointer(),
+    )
+    wrapped_tools = list(discovered_tools)
+    wrapped_tools.extend(_context_tools)
+    # wrapped_tools.append(create_user_question_tool(slack_context))
 
-    try:
-        tools = list(await client.get_tools())
-        wrapped_tools: list[BaseTool] = []
-        approval_mapping = settings.tooling.tool_approvals
-
-        for tool in tools:
-            tool_name = getattr(tool, "name", "")
-            approval_settings = approval_mapping.get(tool_name)
-            if approval_settings:
-                wrapped_tools.append(
-                    tool_approve(
-                        tool,
-                        summary=approval_settings.summary,
-                        context=approval_settings.context,
-                        allow_edit=approval_settings.allow_edit,
-                        allow_reject=approval_settings.allow_reject,
-                    )
-                )
-                continue
-            wrapped_tools.append(tool)
-
-        wrapped_tools.append(create_clear_thread_tool(slack_context))
-        wrapped_tools.append(create_approval_tool(slack_context))
-        # wrapped_tools.append(create_user_question_tool(slack_context))
-
-        db_uri = settings.postgres_url
-        if not db_uri:
-            raise RuntimeError("POSTGRES_URL is not configured")
-
-        async with AsyncPostgresSaver.from_conn_string(db_uri) as checkpointer:
-            await checkpointer.setup()
-            agent_prompt = get_agent_prompt()
-            agent = create_react_agent(
-                settings.tooling.agent_model,
-                wrapped_tools,
-                prompt=agent_prompt,
-                checkpointer=checkpointer,
-            )
+    agent_prompt = await aget_agent_prompt()
+    agent = _get_agent(platform_slugs, wrapped_tools, checkpointer, agent_prompt)
+    return agent, config
 
-            return await agent.ainvoke(payload, config=config)
-    finally:
-        close_async = getattr(client, "aclose", None)
-        if callable(close_async):
-            await close_async()
-        else:
-            close_sync = getattr(client, "close", None)
-            if callable(close_sync):
-                close_sync()
 
+async def ask_agent(
+    payload: dict[str, Any] | Command,
+    *,
+    thread_id: str | None = None,
+    slack_context: Optional[SlackContext] = None,
+):
+    agent, config = await _prepare_run(
+        payload, thread_id=thread_id, slack_context=slack_context
+    )
+    return await agent.ainvoke(payload, config=config)
+
+
+async def astream_agent(
+    payload: dict[str, Any] | Command,
+    *,
+    thread_id: str | None = None,
+    slack_context: Optional[SlackContext] = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield the agent state after each step.
+
+    The last item has the same shape ``ask_agent`` returns, including any
+    ``__interrupt__`` entries, so callers can show progress and then handle
+    the final state as before.
+    """
+
+    agent, config = await _prepare_run(
+        payload, thread_id=thread_id, slack_context=slack_context
+    )
+
+    state: dict[str, Any] = {}
+    interrupts: list[Any] = []
+    # Interrupts only surface in the "updates" stream.
+    async for mode, chunk in agent.astream(
+        payload, config=config, stream_mode=["values", "updates"]
+    ):
+        if mode == "values":
+            state = chunk
+            yield state
+        elif isinstance(chunk, dict) and "__interrupt__" in chunk:
+            interrupts.extend(chunk["__interrupt__"])
+
+    if interrupts:
+        yield {**state, "__interrupt__": interrupts}
@@ -0,0 +1,97 @@
+"""Process-wide LangGraph checkpointer backed by a shared Postgres pool."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import nullcontext
+from typing import Optional
+
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from config import get_settings
+
+_checkpointer: Optional[AsyncPostgresSaver] = None
+_checkpointer_pool: Optional[AsyncConnectionPool] = None
+_checkpointer_lock = asyncio.Lock()
+
+
+class _PooledPostgresSaver(AsyncPostgresSaver):
+    """``AsyncPostgresSaver`` without the per-instance lock.
+
+    Upstream serialises every cursor behind one ``asyncio.Lock`` so a single
+    shared connection is never used concurrently. Over a pool each cursor
+    checks out its own connection, so the lock only queues concurrent
+    threads' checkpoint reads and writes behind each other.
+    """
+
+    def __init__(self, conn: AsyncConnectionPool) -> None:
+        super().__init__(conn)
+        self.lock = nullcontext()  # type: ignore[assignment]
+
+
+async def get_checkpointer() -> AsyncPostgresSaver:
+    """Return the process-wide checkpointer, creating its pool and schema once."""
+
+    global _checkpointer, _checkpointer_pool
+
+    if _checkpointer is not None:
+        return _checkpointer
+
+    async with _checkpointer_lock:
+        if _checkpointer is not None:
+            return _checkpointer
+
+        settings = get_settings()
+        db_uri = settings.postgres_url
+        if not db_uri:
+            raise RuntimeError("POSTGRES_URL is not configured")
+
+        # Same connection settings AsyncPostgresSaver.from_conn_string uses.
+        pool = AsyncConnectionPool(
+            db_uri,
+            min_size=settings.checkpointer_pool_min_size,
+            max_size=settings.checkpointer_pool_max_size,
+            kwargs={
+                "autocommit": True,
+                "prepare_threshold": 0,
+                "row_factory": dict_row,
+            },
+            # Idle connections can be dropped by the server or a proxy; verify
+            # them on checkout rather than failing a checkpoint write.
+            check=AsyncConnectionPool.check_connection,
+            open=False,
+        )
+        await pool.open()
+        try:
+            checkpointer = _PooledPostgresSaver(pool)
+            await checkpointer.setup()
+        except Exception:
+            await pool.close()
+            raise
+
+        _checkpointer_pool = pool
+        _checkpointer = checkpointer
+
+    return _checkpointer
+
+
+async def get_checkpointer_pool() -> AsyncConnectionPool:
+    """Return the connection pool behind the shared checkpointer."""
+
+    await get_checkpointer()
+    assert _checkpointer_pool is not None
+    return _checkpointer_pool
+
+
+async def close_checkpointer() -> None:
+    """Close the shared checkpointer pool; call on application shutdown."""
+
+    global _checkpointer, _checkpointer_pool
+
+    pool = _checkpointer_pool
+    _checkpointer = None
+    _checkpointer_pool = None
+    if pool is not None:
+        await pool.close()
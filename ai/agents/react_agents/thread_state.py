@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
+import os
 import threading
 import uuid
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Tuple
 
+import orjson
 import psycopg
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import StructuredTool
+from psycopg import sql
+from psycopg.rows import dict_row
 
+from ai.agents.react_agents.checkpointer import get_checkpointer_pool
 from config import get_settings
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -23,14 +27,26 @@ logger = logging.getLogger(__name__)
 
 _STATE_FILE = Path("data/langgraph_threads.json")
 
+# The file is only read once per process; lookups are served from memory and
+# the file is rewritten when a mapping is created or rotated.
+_state_cache: Optional[dict[str, str]] = None
+_state_lock = threading.Lock()
+
+_thread_tables_cache: Optional[tuple[str, ...]] = None
+
+_THREAD_TABLES_QUERY = """
+    SELECT table_name
+    FROM information_schema.columns
+    WHERE table_schema = 'public' AND column_name = 'thread_id'
+"""
+
 
 def _load_state() -> dict[str, str]:
     if not _STATE_FILE.exists():
         return {}
 
     try:
-        with _STATE_FILE.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = orjson.loads(_STATE_FILE.read_bytes())
         if isinstance(data, dict):
             return {str(k): str(v) for k, v in data.items()}
     except Exception as exc:  # pragma: no cover - defensive logging
@@ -41,12 +57,23 @@ def _load_state() -> dict[str, str]:
 def _save_state(state: dict[str, str]) -> None:
     try:
         _STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with _STATE_FILE.open("w", encoding="utf-8") as handle:
-            json.dump(state, handle)
+        tmp_path = _STATE_FILE.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(state))
+        os.replace(tmp_path, _STATE_FILE)
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.warning("Failed to persist thread state file: %s", exc)
 
 
+def _get_state() -> dict[str, str]:
+    """Return the in-memory thread mapping; call with ``_state_lock`` held."""
+
+    global _state_cache
+
+    if _state_cache is None:
+        _state_cache = _load_state()
+    return _state_cache
+
+
 def _thread_key(channel_id: str, user_id: str, thread_ts: Optional[str]) -> str:
     base_thread = thread_ts or "root"
     return f"{channel_id}:{base_thread}:{user_id}"
@@ -63,15 +90,16 @@ def get_or_create_thread_id(
 ) -> str:
     """Return the LangGraph thread id used for the Slack context, creating one if missing."""
 
-    state = _load_state()
     key = _thread_key(channel_id, user_id, thread_ts)
-    thread_id = state.get(key)
-    if thread_id:
-        return thread_id
-
-    thread_id = _default_thread_id(channel_id, user_id, thread_ts)
-    state[key] = thread_id
-    _save_state(state)
+    with _state_lock:
+        state = _get_state()
+        thread_id = state.get(key)
+        if thread_id:
+            return thread_id
+
+        thread_id = _default_thread_id(channel_id, user_id, thread_ts)
+        state[key] = thread_id
+        _save_state(state)
     return thread_id
 
 
@@ -83,86 +111,115 @@ def rotate_thread_id(
     Returns a tuple of (old_thread_id, new_thread_id).
     """
 
-    state = _load_state()
     key = _thread_key(channel_id, user_id, thread_ts)
     default_id = _default_thread_id(channel_id, user_id, thread_ts)
-
-    old_thread_id = state.get(key, default_id)
     new_thread_id = f"{default_id}-{uuid.uuid4().hex[:8]}"
 
-    state[key] = new_thread_id
-    _save_state(state)
+    with _state_lock:
+        state = _get_state()
+        old_thread_id = state.get(key, default_id)
+        state[key] = new_thread_id
+        _save_state(state)
 
     return old_thread_id, new_thread_id
 
 
+def _delete_thread_rows(table: str) -> sql.Composed:
+    return sql.SQL("DELETE FROM {} WHERE thread_id = %s").format(sql.Identifier(table))
+
+
+async def _thread_tables(conn: psycopg.AsyncConnection) -> tuple[str, ...]:
+    """Return the tables holding per-thread rows, looked up once per process."""
+
+    global _thread_tables_cache
+
+    if _thread_tables_cache is None:
+        cur = await conn.execute(_THREAD_TABLES_QUERY)
+        _thread_tables_cache = tuple(row["table_name"] for row in await cur.fetchall())
+    return _thread_tables_cache
+
+
 async def clear_thread_history(thread_id: Optional[str]) -> None:
     """Remove any persisted LangGraph checkpoints for the provided thread id."""
 
     if not thread_id:
         return
 
-    conn_str = get_settings().postgres_url
-    if not conn_str:
+    if not get_settings().postgres_url:
         logger.debug("POSTGRES_URL not configured; skipping thread history clear.")
         return
 
     try:
-        conn = await psycopg.AsyncConnection.connect(conn_str)
+        pool = await get_checkpointer_pool()
+        async with pool.connection() as conn:
+            tables = await _thread_tables(conn)
+            # One transaction, pipelined so the deletes share a round-trip.
+            async with conn.transaction(), conn.pipeline():
+                for table in tables:
+                    await conn.execute(_delete_thread_rows(table), (thread_id,))
     except Exception as exc:  # pragma: no cover - defensive logging
-        logger.warning("Failed to connect to Postgres for thread clear: %s", exc)
+        logger.warning(
+            "Failed to clear LangGraph checkpoints for %s: %s", thread_id, exc
+        )
+
+
+def clear_thread_history_sync(thread_id: Optional[str]) -> None:
+    """Blocking :func:`clear_thread_history` for callers without an event loop.
+
+    Uses its own short-lived connection: the checkpointer pool belongs to the
+    application's event loop and can't be driven from another one.
+    """
+
+    global _thread_tables_cache
+
+    if not thread_id:
+        return
+
+    db_uri = get_settings().postgres_url
+    if not db_uri:
+        logger.debug("POSTGRES_URL not configured; skipping thread history clear.")
         return
 
     try:
-        async with conn.cursor() as cur:
-            await cur.execute(
-                """
-                SELECT table_name
-                FROM information_schema.columns
-                WHERE table_schema = 'public' AND column_name = 'thread_id'
-                """
-            )
-            tables = [row[0] for row in await cur.fetchall()]
-
-            for table in tables:
-                try:
-                    await cur.execute(
-                        f'DELETE FROM "{table}" WHERE thread_id = %s', (thread_id,)
-                    )
-                except Exception as table_exc:  # pragma: no cover - defensive logging
-                    logger.debug(
-                        "Skipping deletion from table %s due to error: %s", table, table_exc
-                    )
-
-        await conn.commit()
+        with psycopg.connect(db_uri, autocommit=True, row_factory=dict_row) as conn:
+            if _thread_tables_cache is None:
+                rows = conn.execute(_THREAD_TABLES_QUERY).fetchall()
+                _thread_tables_cache = tuple(row["table_name"] for row in rows)
+            with conn.transaction(), conn.pipeline():
+                for table in _thread_tables_cache:
+                    conn.execute(_delete_thread_rows(table), (thread_id,))
     except Exception as exc:  # pragma: no cover - defensive logging
-        logger.warning("Failed to clear LangGraph checkpoints for %s: %s", thread_id, exc)
-    finally:
-        try:
-            await conn.close()
-        except Exception:  # pragma: no cover - defensive guard
-            pass
+        logger.warning(
+            "Failed to clear LangGraph checkpoints for %s: %s", thread_id, exc
+        )
 
 
-def create_clear_thread_tool(
-    slack_context: Optional["SlackContext"],
-) -> StructuredTool:
-    """Create a tool that clears the LangGraph thread for the provided Slack context."""
+def _slack_context_from_config(
+    config: RunnableConfig | None,
+) -> Optional["SlackContext"]:
+    # Mirrors listeners.agent_interrupts.common.slack_context_from_config; importing
+    # it here would be circular through the listeners package.
+    configurable = (config or {}).get("configurable") or {}
+    return configurable.get("slack_context")
 
-    async def _clear_thread_async() -> str:
+
+def create_clear_thread_tool() -> StructuredTool:
+    """Create a tool that clears the LangGraph thread for the run's Slack context."""
+
+    def _current_thread(config: RunnableConfig) -> tuple[str, str, Optional[str], str]:
+        slack_context = _slack_context_from_config(config)
         if not slack_context:
             raise ValueError("Slack context is required to clear the thread.")
 
         channel_id = slack_context.channel_id
         user_id = slack_context.user_id
         thread_ts = slack_context.thread_ts
-
-        current_thread_id = get_or_create_thread_id(
+        thread_id = get_or_create_thread_id(
             channel_id=channel_id, user_id=user_id, thread_ts=thread_ts
         )
+        return channel_id, user_id, thread_ts, thread_id
 
-        await clear_thread_history(current_thread_id)
-
+    def _rotate(channel_id: str, user_id: str, thread_ts: Optional[str]) -> str:
         old_thread_id, new_thread_id = rotate_thread_id(
             channel_id=channel_id, user_id=user_id, thread_ts=thread_ts
         )
@@ -179,29 +236,15 @@ def create_clear_thread_tool(
             "Future interactions will start fresh."
         )
 
-    def _clear_thread_sync() -> str:
-        try:
-            asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(_clear_thread_async())
-
-        result: dict[str, str] = {}
-        error: dict[str, BaseException] = {}
-
-        def _runner() -> None:
-            try:
-                result["value"] = asyncio.run(_clear_thread_async())
-            except Exception as exc:  # pragma: no cover - defensive guard
-                error["error"] = exc
-
-        thread = threading.Thread(target=_runner, daemon=True)
-        thread.start()
-        thread.join()
-
-        if error:
-            raise error["error"]
+    async def _clear_thread_async(config: RunnableConfig) -> str:
+        channel_id, user_id, thread_ts, thread_id = _current_thread(config)
+        await clear_thread_history(thread_id)
+        return _rotate(channel_id, user_id, thread_ts)
 
-        return result.get("value", "")
+    def _clear_thread_sync(config: RunnableConfig) -> str:
+        channel_id, user_id, thread_ts, thread_id = _current_thread(config)
+        clear_thread_history_sync(thread_id)
+        return _rotate(channel_id, user_id, thread_ts)
 
     return StructuredTool.from_function(
         func=_clear_thread_sync,
@@ -3,16 +3,31 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import inspect
-import json
 import re
 import threading
-from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 from typing import Any, Awaitable, Callable, Optional
+from weakref import WeakValueDictionary
 
+import orjson
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool, StructuredTool, tool as create_tool
 from langgraph.types import interrupt
+from pydantic import BaseModel
+
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_thread: Optional[threading.Thread] = None
+_background_lock = threading.Lock()
+
+# Tools built from plain callables, keyed by the callable's id. Each tool keeps
+# its callable alive, so an id can't be reused while its entry exists.
+_callable_tools: WeakValueDictionary[int, BaseTool] = WeakValueDictionary()
+
+_SEPARATOR_RE = re.compile(r"[_\s]+")
+_SIMPLE_VALUE_TYPES = (str, int, float, bool)
 
 
 def _ensure_tool_instance(tool: Callable | BaseTool) -> BaseTool:
@@ -22,39 +37,52 @@ def _ensure_tool_instance(tool: Callable | BaseTool) -> BaseTool:
         return tool
 
     # Wrap plain callables so we can treat everything uniformly.
-    return create_tool(tool)
+    cached = _callable_tools.get(id(tool))
+    if cached is not None:
+        return cached
+
+    base_tool = create_tool(tool)
+    try:
+        _callable_tools[id(tool)] = base_tool
+    except TypeError:  # pragma: no cover - tool type without weakref support
+        pass
+    return base_tool
 
 
 def _fallback_json_encoder(value):  # type: ignore[no-untyped-def]
-    if is_dataclass(value):
-        return asdict(value)
-    if hasattr(value, "dict") and callable(value.dict):
-        return value.dict()
-    if hasattr(value, "__dict__"):
-        return value.__dict__
+    # orjson serialises dataclasses itself; this only sees other objects.
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    attributes = getattr(value, "__dict__", None)
+    if attributes is not None:
+        return attributes
     return repr(value)
 
 
+@lru_cache(maxsize=1024)
 def _humanize_tool_name(name: str) -> str:
     """Convert a tool identifier into a human-friendly label."""
 
-    cleaned = re.sub(r"[_\s]+", " ", name or "").strip()
+    cleaned = _SEPARATOR_RE.sub(" ", name or "").strip()
     if not cleaned:
         return "Tool Call"
     return cleaned[:1].upper() + cleaned[1:]
 
 
+@lru_cache(maxsize=1024)
 def _humanize_arg_label(value: str) -> str:
     """Convert an argument name into a human-friendly label."""
 
-    cleaned = re.sub(r"[_\s]+", " ", value or "").strip()
+    cleaned = _SEPARATOR_RE.sub(" ", value or "").strip()
     if not cleaned:
         return "Value"
     return cleaned[:1].upper() + cleaned[1:]
 
 
 def _is_simple_value(value: Any) -> bool:
-    return value is None or isinstance(value, (str, int, float, bool))
+    return value is None or isinstance(value, _SIMPLE_VALUE_TYPES)
 
 
 def _format_argument_block(arguments: dict[str, Any]) -> str:
@@ -63,6 +91,13 @@ def _format_argument_block(arguments: dict[str, Any]) -> str:
     if not arguments:
         return "No arguments provided."
 
+    # Most tool calls only carry scalars; skip the JSON encoder entirely.
+    if all(_is_simple_value(value) for value in arguments.values()):
+        return "\n".join(
+            f"{_humanize_arg_label(str(key))}: {'None' if value is None else value}"
+            for key, value in arguments.items()
+        )
+
     lines: list[str] = []
     for raw_key, raw_value in arguments.items():
         label = _humanize_arg_label(str(raw_key))
@@ -72,12 +107,11 @@ def _format_argument_block(arguments: dict[str, Any]) -> str:
             continue
 
         try:
-            serialized = json.dumps(
+            serialized = orjson.dumps(
                 raw_value,
-                indent=2,
-                ensure_ascii=False,
                 default=_fallback_json_encoder,
-            )
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
         except TypeError:
             serialized = str(raw_value)
 
@@ -111,18 +145,21 @@ def tool_approve(
     if summary is None:
         summary = f"Approve running tool `{base_tool.name}`?"
 
+    # Fixed for the lifetime of the wrapper; only the command varies per call.
+    # Shared across payloads, so consumers must treat it as read-only.
+    approval_options = {
+        "allow_approve": True,
+        "allow_edit": allow_edit,
+        "allow_reject": allow_reject,
+    }
+
     def _build_payload(tool_input: dict) -> dict[str, object]:
-        call_representation = _format_tool_call(base_tool.name, tool_input)
         return {
             "type": "approval_request",
             "summary": summary,
-            "command": call_representation,
+            "command": _format_tool_call(base_tool.name, tool_input),
             "additional_context": context,
-            "approval_options": {
-                "allow_approve": True,
-                "allow_edit": allow_edit,
-                "allow_reject": allow_reject,
-            },
+            "approval_options": approval_options,
         }
 
     def _handle_resume(resume_value: object, tool_input: dict) -> tuple[str, object]:
@@ -211,43 +248,75 @@ def _execute_tool_sync(
     return _normalize_output(base_tool, result)
 
 
+@lru_cache(maxsize=256)
+def _accepts_config(callable_obj: Callable) -> bool:
+    return "config" in inspect.signature(callable_obj).parameters
+
+
 def _prepare_callable_kwargs(
     callable_obj: Callable,
     tool_input: dict,
     config: Optional[RunnableConfig],
 ) -> dict:
     kwargs = dict(tool_input)
-    signature = inspect.signature(callable_obj)
-    if "config" in signature.parameters and config is not None:
+    if config is not None and _accepts_config(callable_obj):
         kwargs.setdefault("config", config)
     return kwargs
 
 
-def _run_coroutine_sync(factory: Callable[[], Awaitable[Any]]):
-    """Run an async callable from a synchronous context."""
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the long-lived loop used to drive coroutines from sync code."""
 
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        return asyncio.run(factory())
+    global _background_loop, _background_thread
 
-    result: dict[str, object] = {}
-    error: dict[str, BaseException] = {}
+    if _background_loop is not None:
+        return _background_loop
 
-    def _runner() -> None:
-        try:
-            result["value"] = asyncio.run(factory())
-        except Exception as exc:  # pragma: no cover - defensive guard
-            error["error"] = exc
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="tool-sync-bridge",
+                daemon=True,
+            )
+            thread.start()
+            _background_thread = thread
+            _background_loop = loop
+            atexit.register(_stop_background_loop)
+
+    return _background_loop
 
-    thread = threading.Thread(target=_runner, daemon=True)
-    thread.start()
-    thread.join()
 
-    if error:
-        raise error["error"]
+def _stop_background_loop() -> None:
+    loop, thread = _background_loop, _background_thread
+    if loop is None or thread is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
 
-    return result.get("value")
+
+def _run_coroutine_sync(factory: Callable[[], Awaitable[Any]]):
+    """Run an async callable from a synchronous context.
+
+    Coroutines are submitted to a shared background loop instead of paying for
+    a new thread and event loop on every call.
+
+    The coroutine runs on that background loop, not the caller's. It must not
+    touch loop-bound resources created elsewhere (connection pools, clients,
+    ``asyncio`` locks or futures owned by the application loop); anything it
+    needs has to be created inside the coroutine or be loop-agnostic. Callers
+    with such dependencies need a synchronous implementation instead (see
+    ``thread_state.clear_thread_history_sync``).
+    """
+
+    loop = _get_background_loop()
+    if threading.current_thread() is _background_thread:
+        # Blocking on the loop from its own thread would deadlock.
+        raise RuntimeError("_run_coroutine_sync called from the background loop")
+
+    future = asyncio.run_coroutine_threadsafe(factory(), loop)
+    return future.result()
 
 
 def _normalize_output(base_tool: BaseTool, value: object) -> object:
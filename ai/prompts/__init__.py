@@ -1,14 +1,23 @@
 """Prompt helpers backed by Langfuse with local fallbacks."""
 
 from .langfuse_prompts import (
+    aget_agent_prompt,
+    aget_default_dm_prompt,
+    aget_default_inferred_prompt,
     get_agent_prompt,
     get_default_dm_prompt,
     get_default_inferred_prompt,
+    refresh_prompts_periodically,
+    warm_prompts,
 )
 
 __all__ = [
+    "aget_agent_prompt",
+    "aget_default_dm_prompt",
+    "aget_default_inferred_prompt",
     "get_agent_prompt",
     "get_default_dm_prompt",
     "get_default_inferred_prompt",
+    "refresh_prompts_periodically",
+    "warm_prompts",
 ]
-
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from functools import lru_cache
+import threading
 from typing import Any
 
+import orjson
+
 try:  # pragma: no cover - graceful fallback if the SDK is missing
     from langfuse import Langfuse
 except Exception:  # broad: import error or runtime issues when loading the SDK
@@ -17,6 +19,8 @@ from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+PROMPT_REFRESH_SECONDS = 300.0
+
 _DEFAULT_AGENT_PROMPT = (
     "You are a project management assistant in a slack app. "
     "You can reach MCP tools via this environment. "
@@ -44,6 +48,10 @@ _LANGFUSE_PROMPT_LABEL = _settings.langfuse_prompt_label
 _client: Langfuse | None = None
 _client_init_failed = False
 
+# Resolved prompt text per Langfuse prompt name.
+_prompt_cache: dict[str, str] = {}
+_prompt_lock = threading.Lock()
+
 
 def _get_client() -> Langfuse | None:
     """Return a configured Langfuse client or ``None`` if unavailable."""
@@ -81,7 +89,7 @@ def _normalise_prompt(compiled_prompt: Any, fallback: str) -> str:
             return "\n".join(
                 f"{item.get('role', 'unknown')}: {item.get('content', '')}"
                 if isinstance(item, dict)
-                else json.dumps(item)
+                else orjson.dumps(item).decode()
                 for item in compiled_prompt
             )
         except Exception:  # pragma: no cover - keep fallback when formatting fails
@@ -118,31 +126,128 @@ def _get_prompt_text(
         return fallback
 
 
-@lru_cache(maxsize=1)
+def _cached_prompt(*, name: str | None, fallback: str) -> str:
+    """Resolve ``name`` once per process; safe to call from worker threads."""
+
+    if not name:
+        return fallback
+
+    cached = _prompt_cache.get(name)
+    if cached is not None:
+        return cached
+
+    with _prompt_lock:
+        cached = _prompt_cache.get(name)
+        if cached is None:
+            cached = _get_prompt_text(name=name, fallback=fallback)
+            _prompt_cache[name] = cached
+    return cached
+
+
+async def _acached_prompt(*, name: str | None, fallback: str) -> str:
+    """Async ``_cached_prompt`` that keeps the Langfuse fetch off the event loop."""
+
+    if not name:
+        return fallback
+
+    cached = _prompt_cache.get(name)
+    if cached is not None:
+        return cached
+
+    return await asyncio.to_thread(_cached_prompt, name=name, fallback=fallback)
+
+
 def get_agent_prompt() -> str:
     """Return the agent instruction prompt."""
 
-    return _get_prompt_text(
+    return _cached_prompt(
         name=_settings.langfuse_agent_prompt_name,
         fallback=_DEFAULT_AGENT_PROMPT,
     )
 
 
-@lru_cache(maxsize=1)
 def get_default_dm_prompt() -> str:
     """Return the fallback prompt for empty DM messages."""
 
-    return _get_prompt_text(
+    return _cached_prompt(
         name=_settings.langfuse_dm_prompt_name,
         fallback=_DEFAULT_DM_PROMPT,
     )
 
 
-@lru_cache(maxsize=1)
 def get_default_inferred_prompt() -> str:
     """Return the fallback prompt for inferred mention handling."""
 
-    return _get_prompt_text(
+    return _cached_prompt(
         name=_settings.langfuse_inferred_prompt_name,
         fallback=_DEFAULT_INFERRED_PROMPT,
     )
+
+
+async def aget_agent_prompt() -> str:
+    """Async variant of :func:`get_agent_prompt`."""
+
+    return await _acached_prompt(
+        name=_settings.langfuse_agent_prompt_name,
+        fallback=_DEFAULT_AGENT_PROMPT,
+    )
+
+
+async def aget_default_dm_prompt() -> str:
+    """Async variant of :func:`get_default_dm_prompt`."""
+
+    return await _acached_prompt(
+        name=_settings.langfuse_dm_prompt_name,
+        fallback=_DEFAULT_DM_PROMPT,
+    )
+
+
+async def aget_default_inferred_prompt() -> str:
+    """Async variant of :func:`get_default_inferred_prompt`."""
+
+    return await _acached_prompt(
+        name=_settings.langfuse_inferred_prompt_name,
+        fallback=_DEFAULT_INFERRED_PROMPT,
+    )
+
+
+def _configured_prompts() -> tuple[tuple[str | None, str], ...]:
+    return (
+        (_settings.langfuse_agent_prompt_name, _DEFAULT_AGENT_PROMPT),
+        (_settings.langfuse_dm_prompt_name, _DEFAULT_DM_PROMPT),
+        (_settings.langfuse_inferred_prompt_name, _DEFAULT_INFERRED_PROMPT),
+    )
+
+
+async def warm_prompts() -> None:
+    """Resolve every configured prompt so the first Slack request doesn't wait on Langfuse."""
+
+    await asyncio.gather(
+        aget_agent_prompt(),
+        aget_default_dm_prompt(),
+        aget_default_inferred_prompt(),
+    )
+
+
+def _refresh_prompts() -> None:
+    for name, fallback in _configured_prompts():
+        if not name:
+            continue
+        text = _get_prompt_text(name=name, fallback=fallback)
+        # A failed fetch yields the fallback; keep the last good prompt instead.
+        if text != fallback or name not in _prompt_cache:
+            _prompt_cache[name] = text
+
+
+async def refresh_prompts_periodically(interval: float = PROMPT_REFRESH_SECONDS) -> None:
+    """Re-resolve configured prompts every ``interval`` seconds; run as a background task.
+
+    Cached text is replaced in place, so requests never wait on the refresh.
+    """
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_refresh_prompts)
+        except Exception:  # pragma: no cover - defensive logging
+            logger.warning("Failed to refresh Langfuse prompts", exc_info=True)
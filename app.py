@@ -5,24 +5,16 @@ from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_bolt.async_app import AsyncApp
 
 from config import get_settings
-from langgraph.checkpoint.postgres import PostgresSaver
 from listeners import register_listeners
+from ai.agents.react_agents.checkpointer import close_checkpointer, get_checkpointer
+from ai.prompts import refresh_prompts_periodically, warm_prompts
 
 
 settings = get_settings()
 
-if settings.debug:
-    import debugpy
-
-    debugpy.listen(("0.0.0.0", 5678))
-
-db_uri = settings.postgres_url
-if not db_uri:
+if not settings.postgres_url:
     raise RuntimeError("POSTGRES_URL is not configured")
 
-with PostgresSaver.from_conn_string(db_uri) as checkpointer:
-    checkpointer.setup()
-
 # Initialization
 if not settings.slack_bot_token:
     raise RuntimeError("SLACK_BOT_TOKEN is not configured")
@@ -38,8 +30,24 @@ async def main():
     if not settings.slack_app_token:
         raise RuntimeError("SLACK_APP_TOKEN is not configured")
 
+    if settings.debug:
+        import debugpy
+
+        debugpy.listen(("0.0.0.0", 5678))
+
     handler = AsyncSocketModeHandler(app, settings.slack_app_token)
-    await handler.start_async()
+    prompt_refresh = asyncio.create_task(refresh_prompts_periodically())
+    try:
+        # Open the checkpointer pool, create its schema and fetch prompts while
+        # the socket connects; early events wait on the same lazy initialisers.
+        await asyncio.gather(
+            get_checkpointer(),
+            warm_prompts(),
+            handler.start_async(),
+        )
+    finally:
+        prompt_refresh.cancel()
+        await close_checkpointer()
 
 
 # Start Bolt app
@@ -18,20 +18,21 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 load_dotenv()
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class SlackOAuthConfig:
     signing_secret: str | None
     client_id: str | None
     client_secret: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class MemoryConfig:
     collection: str
     dense_vector_name: str
     sparse_vector_name: str
     embedding_model: str
     llm_model: str
+    use_llm_filter: bool
     openai_api_key: str | None
     qdrant_host: str
     qdrant_http_port: int
@@ -40,11 +41,15 @@ class MemoryConfig:
 def _split_csv(value: str | None) -> tuple[str, ...]:
     if not value:
         return ()
-    return tuple(item.strip() for item in value.split(",") if item.strip())
+    return tuple(item for item in map(str.strip, value.split(",")) if item)
 
 
 class GoogleWorkspaceSettings:
-    """Adapter around Google Workspace environment configuration."""
+    """Adapter around Google Workspace environment configuration.
+
+    Derived values are cached; the underlying ``AppConfig`` is immutable after
+    load, and ``single_user_mode`` toggling doesn't feed into any of them.
+    """
 
     def __init__(self, parent: "AppConfig") -> None:
         self._parent = parent
@@ -63,7 +68,7 @@ class GoogleWorkspaceSettings:
     def base_uri(self) -> str:
         return self._parent.workspace_mcp_base_uri
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         return f"{self.base_uri}:{self.port}"
 
@@ -71,7 +76,7 @@ class GoogleWorkspaceSettings:
     def external_url(self) -> str | None:
         return self._parent.workspace_external_url
 
-    @property
+    @cached_property
     def oauth_base_url(self) -> str:
         return self.external_url or self.base_url
 
@@ -83,7 +88,7 @@ class GoogleWorkspaceSettings:
     def client_secret(self) -> str | None:
         return self._parent.google_oauth_client_secret
 
-    @property
+    @cached_property
     def client_secret_redacted(self) -> str:
         secret = self.client_secret or "Not Set"
         if len(secret) <= 8:
@@ -102,22 +107,19 @@ class GoogleWorkspaceSettings:
     def oauthlib_insecure_transport(self) -> bool:
         return self._parent.oauthlib_insecure_transport
 
-    @property
+    @cached_property
     def redirect_uri(self) -> str:
         return self._parent.google_oauth_redirect_uri or f"{self.base_url}/oauth2callback"
 
-    @property
+    @cached_property
     def custom_redirect_uris(self) -> tuple[str, ...]:
         return _split_csv(self._parent.oauth_custom_redirect_uris)
 
-    @property
+    @cached_property
     def all_redirect_uris(self) -> tuple[str, ...]:
-        uris: tuple[str, ...] = (self.redirect_uri,)
-        if self.custom_redirect_uris:
-            uris = uris + tuple(x for x in self.custom_redirect_uris if x not in uris)
-        return uris
+        return tuple(dict.fromkeys((self.redirect_uri,) + self.custom_redirect_uris))
 
-    @property
+    @cached_property
     def allowed_origins(self) -> tuple[str, ...]:
         defaults: tuple[str, ...] = (
             self.base_url,
@@ -126,11 +128,8 @@ class GoogleWorkspaceSettings:
             "https://github.dev",
         )
         extra = tuple(x for x in _split_csv(self._parent.oauth_allowed_origins) if x)
-        combined: list[str] = []
-        for origin in defaults + extra:
-            if origin not in combined:
-                combined.append(origin)
-        return tuple(combined)
+        # dict.fromkeys dedupes while keeping first-seen order.
+        return tuple(dict.fromkeys(defaults + extra))
 
     @property
     def google_client_secret_path(self) -> str | None:
@@ -187,12 +186,18 @@ class AppConfig(BaseSettings):
 
     # Database
     postgres_url: str | None = Field(default=None, alias="POSTGRES_URL")
+    checkpointer_pool_min_size: int = Field(default=2, alias="CHECKPOINTER_POOL_MIN_SIZE")
+    checkpointer_pool_max_size: int = Field(default=20, alias="CHECKPOINTER_POOL_MAX_SIZE")
+    postgres_pool_size: int = Field(default=10, alias="POSTGRES_POOL_SIZE")
+    postgres_max_overflow: int = Field(default=10, alias="POSTGRES_MAX_OVERFLOW")
 
     # Tooling config file
     tooling_config_file: Path = Field(
         default=PROJECT_ROOT / "config" / "tooling.toml",
         alias="TOOLING_CONFIG_FILE",
     )
+    # Run this repo's own MCP servers (time, memory) inside the app process
+    mcp_inprocess: bool = Field(default=False, alias="MCP_INPROCESS")
 
     # Langfuse prompts
     langfuse_prompt_label: str | None = Field(default=None, alias="LANGFUSE_PROMPT_LABEL")
@@ -227,6 +232,7 @@ class AppConfig(BaseSettings):
         default="text-embedding-3-small", alias="MEMORY_EMBEDDING_MODEL"
     )
     memory_llm_model: str = Field(default="gpt-4.1-mini", alias="MEMORY_LLM_MODEL")
+    memory_use_llm_filter: bool = Field(default=True, alias="MEMORY_USE_LLM_FILTER")
     qdrant_host: str = Field(default="localhost", alias="QDRANT_HOST")
     qdrant_http_port: int = Field(default=6333, alias="QDRANT_HTTP_PORT")
 
@@ -302,6 +308,7 @@ class AppConfig(BaseSettings):
             sparse_vector_name=self.memory_sparse_vector_name,
             embedding_model=self.memory_embedding_model,
             llm_model=self.memory_llm_model,
+            use_llm_filter=self.memory_use_llm_filter,
             openai_api_key=self.openai_api_key,
             qdrant_host=self.qdrant_host,
             qdrant_http_port=self.qdrant_http_port,
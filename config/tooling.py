@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 import tomllib
+from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
 from typing import Any, Iterable, Mapping
@@ -13,7 +15,8 @@ from pydantic.config import ConfigDict
 import os
 
 
-class ToolApprovalSettings(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ToolApprovalSettings:
     """Approval metadata for wrapping tools with user confirmation."""
 
     summary: str
@@ -67,6 +70,10 @@ class MCPServerSettings(BaseModel):
         if "{project_root}" in value:
             value = value.replace("{project_root}", str(project_root))
 
+        # Expand {python} to the running interpreter so stdio servers use our venv
+        if "{python}" in value:
+            value = value.replace("{python}", sys.executable)
+
         # Expand ~ to home dir
         value = os.path.expanduser(value)
 
@@ -121,26 +128,41 @@ class ToolingConfig:
     def tool_approvals(self) -> Mapping[str, ToolApprovalSettings]:
         return self._model.tool_approvals
 
+    @cached_property
+    def _base_client_configs(self) -> dict[str, dict[str, Any]]:
+        return {
+            name: server.as_client_config(project_root=self._project_root)
+            for name, server in self._model.servers.base.items()
+        }
+
+    @cached_property
+    def _platform_client_configs(self) -> dict[str, dict[str, Any]]:
+        return {
+            slug: server.as_client_config(project_root=self._project_root)
+            for slug, server in self._model.servers.platforms.items()
+        }
+
+    @cached_property
+    def platform_slugs(self) -> frozenset[str]:
+        """Platform slugs that have an MCP server configured."""
+
+        return frozenset(self._platform_client_configs)
+
     def server_config(
         self,
         platform_slugs: Iterable[str],
     ) -> dict[str, dict[str, Any]]:
-        """Return the server configuration tailored to the provided platforms."""
+        """Return the server configuration tailored to the provided platforms.
 
-        config: dict[str, dict[str, Any]] = {}
+        Entries are materialised once per process; callers get shallow copies.
+        """
 
-        for name, server in self._model.servers.base.items():
-            config[name] = server.as_client_config(
-                project_root=self._project_root,
-            )
+        config: dict[str, dict[str, Any]] = {
+            name: dict(entry) for name, entry in self._base_client_configs.items()
+        }
 
-        for slug in platform_slugs:
-            server = self._model.servers.platforms.get(slug)
-            if server is None:
-                continue
-            config[slug] = server.as_client_config(
-                project_root=self._project_root,
-            )
+        for slug in self.platform_slugs.intersection(platform_slugs):
+            config[slug] = dict(self._platform_client_configs[slug])
 
         return config
 
@@ -151,6 +173,7 @@ class ToolingConfig:
         *,
         project_root: Path,
     ) -> "ToolingConfig":
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
+        with path.open("rb") as handle:
+            data = tomllib.load(handle)
         file_model = ToolingFileModel.model_validate(data)
         return cls(file_model=file_model, project_root=project_root)
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Integer, JSON, String
+from sqlalchemy import (
+    ForeignKey,
+    Integer,
+    JSON,
+    String,
+    UniqueConstraint,
+    bindparam,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship
 
 from .base import Base
@@ -21,6 +30,7 @@ class User(Base):
     management_platform_links: Mapped[list["UserManagementPlatform"]] = relationship(
         back_populates="user",
         cascade="all, delete-orphan",
+        order_by="UserManagementPlatform.id",
     )
 
     def __repr__(self) -> str:  # pragma: no cover - debugging helper
@@ -32,14 +42,26 @@ class User(Base):
     def create_if_not_exists(cls, session: Session, slack_user_id: str) -> "User":
         """Return the existing user or create a new record for the Slack ID."""
 
-        user = session.query(cls).filter_by(slack_user_id=slack_user_id).one_or_none()
+        user = session.execute(
+            _SELECT_USER_BY_SLACK, {"slack_user_id": slack_user_id}
+        ).scalar_one_or_none()
         if user is not None:
             return user
 
-        user = cls(slack_user_id=slack_user_id)
-        session.add(user)
-        session.flush()  # ensure `id` is populated for downstream callers
-        return user
+        # Insert and load the row in one round trip; a concurrent creator
+        # wins the conflict and we read its row instead.
+        user = session.scalars(
+            pg_insert(cls)
+            .values(slack_user_id=slack_user_id)
+            .on_conflict_do_nothing(index_elements=[cls.slack_user_id])
+            .returning(cls)
+        ).one_or_none()
+        if user is not None:
+            return user
+
+        return session.execute(
+            _SELECT_USER_BY_SLACK, {"slack_user_id": slack_user_id}
+        ).scalar_one()
 
 
 class ManagementPlatform(Base):
@@ -63,6 +85,13 @@ class UserManagementPlatform(Base):
     """Association between users and their chosen management platforms."""
 
     __tablename__ = "user_management_platforms"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "management_platform_id",
+            name="uq_user_management_platforms_user_platform",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -76,7 +105,13 @@ class UserManagementPlatform(Base):
     platform_user_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
     user: Mapped[User] = relationship(back_populates="management_platform_links")
-    platform: Mapped[ManagementPlatform] = relationship(back_populates="user_links")
+    # Every link is rendered with its platform, so load it in the same query
+    # rather than one lazy SELECT per link.
+    platform: Mapped[ManagementPlatform] = relationship(
+        back_populates="user_links",
+        lazy="joined",
+        innerjoin=True,
+    )
 
     def __repr__(self) -> str:  # pragma: no cover - debugging helper
         return (
@@ -84,3 +119,9 @@ class UserManagementPlatform(Base):
             f"user_id={self.user_id!r}, platform_id={self.management_platform_id!r}, "
             f"platform_user_id={self.platform_user_id!r})"
         )
+
+
+# Built once so every lookup reuses the same compiled statement from the cache.
+_SELECT_USER_BY_SLACK = select(User).where(
+    User.slack_user_id == bindparam("slack_user_id")
+)
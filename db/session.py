@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import threading
 from collections.abc import Generator
 
 from sqlalchemy import Engine, create_engine
@@ -20,20 +21,40 @@ def _build_conn_str() -> str:
 
 _engine: Engine | None = None
 SessionLocal: sessionmaker[Session] | None = None
+_engine_lock = threading.Lock()
 
 
 def get_engine(echo: bool = False) -> Engine:
     """Return a singleton SQLAlchemy engine."""
 
     global _engine, SessionLocal  # pylint: disable=global-statement
-    if _engine is None:
-        conn_str = _build_conn_str()
-        _engine = create_engine(conn_str, echo=echo)
-        SessionLocal = sessionmaker(
-            bind=_engine,
-            autoflush=False,
-            expire_on_commit=False,
-        )
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            settings = get_settings()
+            conn_str = _build_conn_str()
+            engine = create_engine(
+                conn_str,
+                echo=echo,
+                pool_size=settings.postgres_pool_size,
+                max_overflow=settings.postgres_max_overflow,
+                # Drop connections the server closed while idle instead of failing
+                # the Slack action that happens to check one out.
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                # Reuse the most recently returned connection so idle ones can age out.
+                pool_use_lifo=True,
+            )
+            SessionLocal = sessionmaker(
+                bind=engine,
+                autoflush=False,
+                expire_on_commit=False,
+            )
+            # Publish the engine last: callers that skip the lock treat a set
+            # ``_engine`` as "SessionLocal is ready".
+            _engine = engine
     return _engine
 
 
@@ -43,12 +64,5 @@ def get_session(*, echo: bool = False) -> Generator[Session, None, None]:
 
     engine = get_engine(echo=echo)
     assert SessionLocal is not None  # for type checkers
-    session = SessionLocal()
-    try:
+    with SessionLocal() as session, session.begin():
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
-    finally:
-        session.close()
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 from logging import Logger
 from typing import Any, Optional
-import json
 
+import orjson
 from slack_bolt import Ack
 from slack_sdk import WebClient
 
 from ai.agents.react_agents.all_tools import SlackContext, ask_agent
-from langgraph.errors import GraphInterrupt
 from langgraph.types import Command
 from listeners.agent_interrupts import (
     build_agent_response_blocks,
@@ -24,6 +24,32 @@ from listeners.agent_interrupts.storage import (
 )
 
 
+# Static parts of the edit modal, shared across requests; the Slack client only
+# serialises them, so they are never mutated.
+_EDIT_MODAL_CHROME = {
+    "title": {"type": "plain_text", "text": "Provide more info"},
+    "submit": {"type": "plain_text", "text": "Submit"},
+    "close": {"type": "plain_text", "text": "Cancel"},
+}
+
+_EDIT_MODAL_NOTES_BLOCK = {
+    "type": "input",
+    "block_id": "notes_block",
+    "label": {"type": "plain_text", "text": "Add context or edits"},
+    "element": {
+        "type": "plain_text_input",
+        "action_id": "notes_input",
+        "multiline": True,
+    },
+}
+
+_DECISION_LABELS = {
+    "approved": ":white_check_mark: Approved",
+    "rejected": ":x: Rejected",
+    "edited": ":memo: Edited",
+}
+
+
 async def approve_request(logger: Logger, ack: Ack, body: dict, client: WebClient):
     await ack()
     await _process_decision(
@@ -57,10 +83,8 @@ async def start_edit_request(logger: Logger, ack: Ack, body: dict, client: WebCl
         modal_view = {
             "type": "modal",
             "callback_id": APPROVAL_EDIT_MODAL_CALLBACK,
-            "private_metadata": json.dumps({"interrupt_id": interrupt_id}),
-            "title": {"type": "plain_text", "text": "Provide more info"},
-            "submit": {"type": "plain_text", "text": "Submit"},
-            "close": {"type": "plain_text", "text": "Cancel"},
+            "private_metadata": orjson.dumps({"interrupt_id": interrupt_id}).decode(),
+            **_EDIT_MODAL_CHROME,
             "blocks": [
                 {
                     "type": "section",
@@ -69,16 +93,7 @@ async def start_edit_request(logger: Logger, ack: Ack, body: dict, client: WebCl
                         "text": f"*Command*\n```{request['command']}```",
                     },
                 },
-                {
-                    "type": "input",
-                    "block_id": "notes_block",
-                    "label": {"type": "plain_text", "text": "Add context or edits"},
-                    "element": {
-                        "type": "plain_text_input",
-                        "action_id": "notes_input",
-                        "multiline": True,
-                    },
-                },
+                _EDIT_MODAL_NOTES_BLOCK,
             ],
         }
 
@@ -90,8 +105,8 @@ async def start_edit_request(logger: Logger, ack: Ack, body: dict, client: WebCl
 async def submit_edit_request(logger: Logger, ack: Ack, body: dict, client: WebClient):
     await ack()
     try:
-        metadata = json.loads(body["view"]["private_metadata"])
-    except (KeyError, json.JSONDecodeError) as error:
+        metadata = orjson.loads(body["view"]["private_metadata"])
+    except (KeyError, orjson.JSONDecodeError) as error:
         logger.error("Invalid modal metadata: %s", error)
         return
 
@@ -143,6 +158,8 @@ async def _process_decision(
             return
 
         reviewer_id = body.get("user", {}).get("id")
+        # Replace the buttons before resuming: if this update fails, a second
+        # click must not be able to resume (and run the tool) twice.
         await _update_approval_message(
             client=client,
             request=request,
@@ -193,21 +210,25 @@ async def _resume_agent(
     if notes:
         resume_value["notes"] = notes
 
-    if notes:
-        reviewer_label = f"<@{reviewer_id}>" if reviewer_id else "a reviewer"
-        await client.chat_postMessage(
-            channel=request["channel_id"],
-            thread_ts=request["thread_ts"],
-            text=f"Additional context from {reviewer_label}:\n{notes}",
-        )
-
-
-    response = await ask_agent(
+    agent_call = ask_agent(
         Command(resume=resume_value),
         thread_id=request["thread_id"],
         slack_context=slack_context,
     )
 
+    if notes:
+        reviewer_label = f"<@{reviewer_id}>" if reviewer_id else "a reviewer"
+        _, response = await asyncio.gather(
+            client.chat_postMessage(
+                channel=request["channel_id"],
+                thread_ts=request["thread_ts"],
+                text=f"Additional context from {reviewer_label}:\n{notes}",
+            ),
+            agent_call,
+        )
+    else:
+        response = await agent_call
+
     if "__interrupt__" in response:
         for interrupt in response["__interrupt__"]:
             await handle_agent_interrupt(
@@ -247,13 +268,7 @@ async def _update_approval_message(
     channel_id = request["channel_id"]
     approval_ts = request["approval_message_ts"]
 
-    parts = {
-        "approved": ":white_check_mark: Approved",
-        "rejected": ":x: Rejected",
-        "edited": ":memo: Edited",
-    }
-
-    decision_text = parts.get(decision, decision.capitalize())
+    decision_text = _DECISION_LABELS.get(decision, decision.capitalize())
     if reviewer_id:
         decision_text = f"{decision_text} by <@{reviewer_id}>"
 
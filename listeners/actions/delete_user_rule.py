@@ -4,11 +4,54 @@ from logging import Logger
 
 from slack_bolt import Ack
 from slack_sdk import WebClient
-from sqlalchemy import select
+from sqlalchemy import text
 
-from db.models import User
 from db.session import get_session
-from listeners.events.app_home_opened import build_app_home_view
+from listeners.events.app_home_opened import HomeProfile, build_app_home_view
+from listeners.user_preferences import extract_rules_from_preferences
+
+
+# Filter the rule out server-side so a click is one UPDATE instead of a row
+# read followed by a full rewrite of the preferences blob. Same cleanup as the
+# Python path this replaced: rules are trimmed of all leading/trailing
+# whitespace (like ``str.strip``), blanks dropped, JSON nulls kept as the
+# string "None" (``str(None)``), and the key removed once the list is empty.
+# /rule only ever stores strings; other JSON values keep their JSON text.
+_DELETE_RULE = text(
+    """
+    UPDATE users
+    SET model_preferences = (
+        CASE
+            WHEN filtered.rules = '[]'::jsonb
+                THEN coalesce(users.model_preferences::jsonb, '{}'::jsonb) - 'rules'
+            ELSE jsonb_set(
+                coalesce(users.model_preferences::jsonb, '{}'::jsonb),
+                '{rules}',
+                filtered.rules
+            )
+        END
+    )::json
+    FROM (
+        SELECT coalesce(jsonb_agg(cleaned.rule ORDER BY elem.ord), '[]'::jsonb) AS rules
+        FROM users AS source
+        CROSS JOIN LATERAL jsonb_array_elements_text(
+            CASE
+                WHEN jsonb_typeof(source.model_preferences::jsonb -> 'rules') = 'array'
+                    THEN source.model_preferences::jsonb -> 'rules'
+                ELSE '[]'::jsonb
+            END
+        ) WITH ORDINALITY AS elem(value, ord)
+        CROSS JOIN LATERAL (
+            SELECT regexp_replace(coalesce(elem.value, 'None'), '^\\s+|\\s+$', '', 'g')
+        ) AS cleaned(rule)
+        WHERE source.slack_user_id = :slack_user_id
+            AND cleaned.rule <> ''
+            AND cleaned.rule <> :rule_text
+    ) AS filtered
+    WHERE users.slack_user_id = :slack_user_id
+    RETURNING users.first_name, users.last_name, users.model_preferences
+    """
+)
 
 
 async def delete_user_rule(logger: Logger, ack: Ack, body: dict, client: WebClient):
@@ -31,33 +74,23 @@ async def delete_user_rule(logger: Logger, ack: Ack, body: dict, client: WebClie
             raise ValueError("Missing rule text in action value")
 
         with get_session() as session:
-            user = (
-                session.execute(select(User).where(User.slack_user_id == slack_user_id))
-                .scalar_one_or_none()
+            updated = session.execute(
+                _DELETE_RULE,
+                {"slack_user_id": slack_user_id, "rule_text": rule_text},
+            ).first()
+        # The session is closed before calling Slack so the pooled connection
+        # isn't held across the views.publish round trip.
+        profile = None
+        if updated is None:
+            logger.info("User %s not found while deleting rule", slack_user_id)
+        else:
+            profile = HomeProfile(
+                first_name=(updated.first_name or "").strip(),
+                last_name=(updated.last_name or "").strip(),
+                rules=extract_rules_from_preferences(updated.model_preferences),
             )
-            if user is None:
-                logger.info("User %s not found while deleting rule", slack_user_id)
-            else:
-                preferences = dict(user.model_preferences or {})
-                rules_value = preferences.get("rules")
-
-                if isinstance(rules_value, list):
-                    filtered_rules = [
-                        str(item).strip()
-                        for item in rules_value
-                        if str(item).strip() and str(item).strip() != rule_text
-                    ]
-                else:
-                    filtered_rules = []
-
-                if filtered_rules:
-                    preferences["rules"] = filtered_rules
-                elif "rules" in preferences:
-                    preferences.pop("rules", None)
-
-                user.model_preferences = preferences
 
-        view = build_app_home_view(slack_user_id)
+        view = build_app_home_view(slack_user_id, profile)
         await client.views_publish(user_id=slack_user_id, view=view)
 
     except Exception as exc:  # pragma: no cover - defensive logging
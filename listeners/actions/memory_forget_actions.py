@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 from logging import Logger
 from typing import Dict, List
 
@@ -100,10 +99,8 @@ async def delete_memory_request(
         )
         return
 
-    loop = asyncio.get_running_loop()
-
     try:
-        result = await loop.run_in_executor(None, delete_memories, [memory_id])
+        result = await delete_memories([memory_id])
     except Exception as error:  # pragma: no cover - Slack runtime handler
         logger.error("Failed to delete memory %s: %s", memory_id, error)
         await respond(
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import json
 from logging import Logger
 from typing import Optional
 
+import orjson
 from slack_bolt import Ack
 from slack_sdk import WebClient
 
 from ai.agents.react_agents.all_tools import SlackContext, ask_agent
-from langgraph.errors import GraphInterrupt
 from langgraph.types import Command
 from listeners.agent_interrupts import (
     build_agent_response_blocks,
@@ -43,7 +42,7 @@ async def open_question_modal(logger: Logger, ack: Ack, body: dict, client: WebC
         modal_view = {
             "type": "modal",
             "callback_id": QUESTION_MODAL_CALLBACK,
-            "private_metadata": json.dumps({"interrupt_id": interrupt_id}),
+            "private_metadata": orjson.dumps({"interrupt_id": interrupt_id}).decode(),
             "title": {"type": "plain_text", "text": request.get("modal_title", "Provide an answer")},
             "submit": {"type": "plain_text", "text": request.get("submit_label", "Submit")},
             "close": {"type": "plain_text", "text": "Cancel"},
@@ -90,7 +89,7 @@ async def open_question_modal(logger: Logger, ack: Ack, body: dict, client: WebC
 
 async def submit_question_modal(logger: Logger, ack: Ack, body: dict, client: WebClient):
     try:
-        metadata = json.loads(body["view"]["private_metadata"])
+        metadata = orjson.loads(body["view"]["private_metadata"])
         interrupt_id = metadata.get("interrupt_id")
         if not interrupt_id:
             raise ValueError("Missing interrupt id in modal metadata")
@@ -8,6 +8,7 @@ from sqlalchemy import select
 
 from db.models import ManagementPlatform, User, UserManagementPlatform
 from db.session import get_session
+from listeners.user_management_platforms import invalidate_user_platform_slugs
 
 
 async def set_management_platforms(logger: Logger, ack: Ack, body: dict):
@@ -59,5 +60,7 @@ async def set_management_platforms(logger: Logger, ack: Ack, body: dict):
                 if slug not in selected_slugs:
                     session.delete(link)
 
+        invalidate_user_platform_slugs(slack_user_id)
+
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.exception("Failed to update management platforms: %s", exc)
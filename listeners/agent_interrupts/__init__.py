@@ -1,7 +1,9 @@
 """Aggregates Slack interrupt tooling for the agent."""
 
 from listeners.agent_interrupts.common import (
+    AgentProgressUpdater,
     build_agent_response_blocks,
+    describe_agent_progress,
     extract_last_ai_text,
     sanitize_text,
 )
@@ -12,7 +14,9 @@ from listeners.agent_interrupts.tools import (
 )
 
 __all__ = [
+    "AgentProgressUpdater",
     "build_agent_response_blocks",
+    "describe_agent_progress",
     "extract_last_ai_text",
     "handle_agent_interrupt",
     "create_approval_tool",
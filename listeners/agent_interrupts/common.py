@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 from dataclasses import dataclass
+from functools import lru_cache
+from logging import Logger
 from typing import Any, Iterable
 from typing_extensions import Optional
+
+import orjson
 from langchain_core.messages import AIMessage
 from langchain_core.messages.base import BaseMessage
+from langchain_core.runnables import RunnableConfig
+from slack_sdk import WebClient
+
+# Minimum gap between progress edits of the placeholder message; chat.update is
+# rate limited per channel and intermediate statuses are disposable.
+PROGRESS_UPDATE_INTERVAL_SECONDS = 1.0
 
 
 @dataclass(frozen=True)
@@ -20,14 +30,28 @@ class SlackContext:
     thread_id: Optional[str]
 
     def as_json(self) -> str:
-        return json.dumps(
-            {
-                "channel_id": self.channel_id,
-                "user_id": self.user_id,
-                "thread_ts": self.thread_ts,
-                "thread_id": self.thread_id,
-            }
-        )
+        return _serialize_slack_context(self)
+
+
+@lru_cache(maxsize=1024)
+def _serialize_slack_context(context: SlackContext) -> str:
+    # Frozen, so the payload never changes for a given context.
+    return orjson.dumps(
+        {
+            "channel_id": context.channel_id,
+            "user_id": context.user_id,
+            "thread_ts": context.thread_ts,
+            "thread_id": context.thread_id,
+        }
+    ).decode()
+
+
+def slack_context_from_config(config: RunnableConfig | None) -> Optional[SlackContext]:
+    """Return the Slack context ``ask_agent`` placed in the run's configurable."""
+
+    configurable = (config or {}).get("configurable") or {}
+    slack_context = configurable.get("slack_context")
+    return slack_context if isinstance(slack_context, SlackContext) else None
 
 
 def sanitize_text(value: str | None, fallback: str) -> str:
@@ -57,6 +81,82 @@ def build_agent_response_blocks(prompt: str, response_text: str) -> list[dict[st
     ]
 
 
+def describe_agent_progress(state: dict[str, Any]) -> Optional[str]:
+    """Return a short status line when the agent is about to call tools."""
+
+    messages = state.get("messages") or []
+    if not messages:
+        return None
+
+    last_message = messages[-1]
+    if not isinstance(last_message, AIMessage) or not last_message.tool_calls:
+        return None
+
+    names = ", ".join(f"`{call['name']}`" for call in last_message.tool_calls)
+    return f"Working on it… calling {names}"
+
+
+class AgentProgressUpdater:
+    """Best-effort progress edits of a placeholder message while the agent streams.
+
+    ``update`` never blocks the stream: edits run in a background task,
+    at most one per ``interval`` with the newest status winning, and Slack
+    errors are logged rather than raised. Call ``aclose`` before posting the
+    final answer so a late progress edit can't overwrite it.
+    """
+
+    def __init__(
+        self,
+        client: WebClient,
+        *,
+        channel_id: str,
+        ts: Optional[str],
+        logger: Logger,
+        interval: float = PROGRESS_UPDATE_INTERVAL_SECONDS,
+    ) -> None:
+        self._client = client
+        self._channel_id = channel_id
+        self._ts = ts
+        self._logger = logger
+        self._interval = interval
+        self._status: Optional[str] = None
+        self._pending: Optional[str] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def update(self, state: dict[str, Any]) -> None:
+        progress = describe_agent_progress(state)
+        if not self._ts or not progress or progress == self._status:
+            return
+
+        self._status = progress
+        self._pending = progress
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        while self._pending is not None:
+            text, self._pending = self._pending, None
+            try:
+                await self._client.chat_update(
+                    channel=self._channel_id,
+                    ts=self._ts,
+                    text=text,
+                )
+            except Exception as exc:  # best effort; the final update still runs
+                self._logger.warning("Failed to post agent progress: %s", exc)
+            await asyncio.sleep(self._interval)
+
+    async def aclose(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+
 def extract_last_ai_text(messages: Iterable[BaseMessage]) -> str:
     """Return the newest non-empty AI message text from the conversation."""
 
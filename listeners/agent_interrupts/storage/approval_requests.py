@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
+
 
 APPROVAL_STORE = Path("data/approval_requests")
 
@@ -16,8 +17,9 @@ def _ensure_dir() -> None:
 
 def save_request(interrupt_id: str, payload: Dict[str, Any]) -> None:
     _ensure_dir()
-    with open(APPROVAL_STORE / f"{interrupt_id}.json", "w", encoding="utf-8") as file:
-        json.dump(payload, file)
+    (APPROVAL_STORE / f"{interrupt_id}.json").write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    )
 
 
 def load_request(interrupt_id: str) -> Optional[Dict[str, Any]]:
@@ -25,11 +27,10 @@ def load_request(interrupt_id: str) -> Optional[Dict[str, Any]]:
     if not filepath.exists():
         return None
 
-    with open(filepath, "r", encoding="utf-8") as file:
-        try:
-            return json.load(file)
-        except json.JSONDecodeError:
-            return None
+    try:
+        return orjson.loads(filepath.read_bytes())
+    except orjson.JSONDecodeError:
+        return None
 
 
 def delete_request(interrupt_id: str) -> None:
@@ -4,27 +4,34 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
+from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import StructuredTool
 from langgraph.types import interrupt
 
+from listeners.agent_interrupts.common import slack_context_from_config
+
 if TYPE_CHECKING:  # pragma: no cover - import for typing only
     from listeners.agent_interrupts.common import SlackContext
 
 
-def create_approval_tool(
-    slack_context: Optional["SlackContext"],
-) -> StructuredTool:
-    """Create a structured tool that interrupts execution pending Slack approval."""
+def create_approval_tool() -> StructuredTool:
+    """Create a structured tool that interrupts execution pending Slack approval.
 
-    context_payload = slack_context.as_json() if slack_context else None
+    The Slack context is read from the run config at call time, so one tool
+    instance can be shared by every conversation.
+    """
 
     def request_slack_approval(
         command: str,
         summary: str,
+        config: RunnableConfig,
         additional_context: str | None = None,
     ) -> dict[str, Any]:
         """Request a human reviewer in Slack to approve a command before it runs."""
 
+        slack_context = slack_context_from_config(config)
+        context_payload = slack_context.as_json() if slack_context else None
+
         approval_payload: Dict[str, Any] = {
             "type": "approval_request",
             "command": command,
@@ -1,5 +1,3 @@
-import asyncio
-from functools import partial
 from logging import Logger
 from typing import Any, Dict, List
 from uuid import uuid4
@@ -43,8 +41,7 @@ async def remember_callback(
             text="Let me save that for you",
         )
 
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, save_memory, text)
+        result = await save_memory(text)
 
         saved_count = result.get("saved", 0)
         if saved_count <= 0:
@@ -109,8 +106,7 @@ async def ask_memory_callback(
         )
 
 
-        loop = asyncio.get_running_loop()
-        results = await loop.run_in_executor(None, search_memory, query)
+        results = await search_memory(query)
 
 
         if not results:
@@ -227,9 +223,7 @@ async def forget_memory_callback(
             )
             return
 
-        loop = asyncio.get_running_loop()
-        search_fn = partial(search_memory, query, 5, 3)
-        results = await loop.run_in_executor(None, search_fn)
+        results = await search_memory(query, 5, 3)
 
         if not results:
             await client.chat_postEphemeral(
@@ -1,4 +1,6 @@
 from logging import Logger
+from typing import NamedTuple
+
 from ai.providers import get_available_providers
 from slack_sdk import WebClient
 from sqlalchemy import select
@@ -36,12 +38,15 @@ async def app_home_opened_callback(event: dict, logger: Logger, client: WebClien
         logger.error("Failed to publish app home: %s", exc)
 
 
-def build_app_home_view(user_id: str) -> dict:
-    """Return the rendered view for the Slack App Home."""
+class HomeProfile(NamedTuple):
+    """Per-user fields rendered on the App Home."""
+
+    first_name: str
+    last_name: str
+    rules: list[str]
 
-    first_name = ""
-    last_name = ""
-    rules: list[str] = []
+
+def _load_home_profile(user_id: str) -> HomeProfile:
     with get_session() as session:
         user_record = (
             session.execute(select(User).where(User.slack_user_id == user_id))
@@ -50,9 +55,23 @@ def build_app_home_view(user_id: str) -> dict:
         if user_record is None:
             user_record = User.create_if_not_exists(session, slack_user_id=user_id)
 
-        first_name = (user_record.first_name or "").strip()
-        last_name = (user_record.last_name or "").strip()
-        rules = extract_rules_from_preferences(user_record.model_preferences)
+        return HomeProfile(
+            first_name=(user_record.first_name or "").strip(),
+            last_name=(user_record.last_name or "").strip(),
+            rules=extract_rules_from_preferences(user_record.model_preferences),
+        )
+
+
+def build_app_home_view(user_id: str, profile: HomeProfile | None = None) -> dict:
+    """Return the rendered view for the Slack App Home.
+
+    Callers that already hold the user's profile (e.g. from an UPDATE ...
+    RETURNING) can pass it as ``profile`` to skip reloading the user row.
+    """
+
+    if profile is None:
+        profile = _load_home_profile(user_id)
+    first_name, last_name, rules = profile
 
     # create a list of options for the dropdown menu each containing the model name and provider
     options = [
@@ -8,10 +8,11 @@ from typing import Any
 from slack_bolt import Say
 from slack_sdk import WebClient
 
-from ai.agents.react_agents.all_tools import ask_agent
+from ai.agents.react_agents.all_tools import astream_agent
 from ai.agents.react_agents.thread_state import get_or_create_thread_id
-from ai.prompts import get_default_inferred_prompt
+from ai.prompts import aget_default_inferred_prompt
 from listeners.agent_interrupts import (
+    AgentProgressUpdater,
     build_agent_response_blocks,
     extract_last_ai_text,
     handle_agent_interrupt,
@@ -48,7 +49,7 @@ async def app_mentioned_callback(client: WebClient, event: dict, logger: Logger,
         thread_ts = event_ts
 
     if not cleaned_text:
-        cleaned_text = get_default_inferred_prompt()
+        cleaned_text = await aget_default_inferred_prompt()
 
     waiting_message = None
 
@@ -94,11 +95,23 @@ async def app_mentioned_callback(client: WebClient, event: dict, logger: Logger,
 
         agent_payload = {"messages": messages}
 
-        response = await ask_agent(
-            agent_payload,
-            thread_id=thread_id,
-            slack_context=slack_context,
+        response: dict[str, Any] = {}
+        # Reflect tool calls in the placeholder while the agent works.
+        progress = AgentProgressUpdater(
+            client,
+            channel_id=channel_id,
+            ts=waiting_message["ts"],
+            logger=logger,
         )
+        try:
+            async for response in astream_agent(
+                agent_payload,
+                thread_id=thread_id,
+                slack_context=slack_context,
+            ):
+                progress.update(response)
+        finally:
+            await progress.aclose()
 
         if "__interrupt__" in response:
             await client.chat_update(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 
 from sqlalchemy import select
@@ -9,6 +10,10 @@ from sqlalchemy import select
 from db.models import ManagementPlatform, User, UserManagementPlatform
 from db.session import get_session
 
+PLATFORM_SLUG_CACHE_TTL_SECONDS = 60.0
+
+_platform_slug_cache: dict[str, tuple[float, frozenset[str]]] = {}
+
 
 @dataclass(frozen=True)
 class UserPlatformSelection:
@@ -56,6 +61,32 @@ def get_user_management_platforms(slack_user_id: str | None) -> list[UserPlatfor
     return selections
 
 
+def get_user_platform_slugs(slack_user_id: str | None) -> frozenset[str]:
+    """Return the lower-cased platform slugs for the user, cached briefly per user."""
+
+    if not slack_user_id:
+        return frozenset()
+
+    now = time.monotonic()
+    cached = _platform_slug_cache.get(slack_user_id)
+    if cached and now - cached[0] < PLATFORM_SLUG_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    slugs = frozenset(
+        selection.slug.lower()
+        for selection in get_user_management_platforms(slack_user_id)
+    )
+    _platform_slug_cache[slack_user_id] = (now, slugs)
+    return slugs
+
+
+def invalidate_user_platform_slugs(slack_user_id: str | None) -> None:
+    """Drop any cached platform slugs for the user after their selection changes."""
+
+    if slack_user_id:
+        _platform_slug_cache.pop(slack_user_id, None)
+
+
 def list_management_platforms() -> list[ManagementPlatform]:
     """Return all management platforms configured in the system."""
 
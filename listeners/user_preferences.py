@@ -75,8 +75,9 @@ def build_user_metadata_message(slack_user_id: str) -> dict[str, str] | None:
         stmt = (
             select(User)
             .options(
-                selectinload(User.management_platform_links)
-                .selectinload(UserManagementPlatform.platform)
+                selectinload(User.management_platform_links).joinedload(
+                    UserManagementPlatform.platform, innerjoin=True
+                )
             )
             .where(User.slack_user_id == slack_user_id)
         )